@@ -1,23 +1,144 @@
 """Database layer for noGojira using SQLite."""
 
 import json
+import math
 import os
+import re
 import sqlite3
-from collections.abc import Generator
+import threading
+import weakref
+from collections.abc import Callable, Generator
 from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
+from uuid import uuid4
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 from .models import (
     PRD,
     Comment,
+    CommentType,
     EntityType,
+    PRDStatus,
     Project,
+    ProjectWithStats,
     Story,
+    StoryStatus,
     Task,
+    TaskStatus,
+)
+
+_INSERT_PROJECT_SQL = """
+    INSERT INTO projects (id, name, description, created_at, updated_at, metadata)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_PRD_SQL = """
+    INSERT INTO prds
+    (id, project_id, title, description, status, created_by,
+     created_at, updated_at, metadata)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_STORY_SQL = """
+    INSERT INTO stories
+    (id, prd_id, agent_id, title, description, status, assigned_to,
+     story_points, acceptance_criteria, created_at, updated_at, metadata)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_TASK_SQL = """
+    INSERT INTO tasks
+    (id, story_id, agent_id, title, description, status, assigned_to,
+     depends_on, created_at, updated_at, metadata)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_COMMENT_SQL = """
+    INSERT INTO comments
+    (id, entity_type, entity_id, author, content, comment_type,
+     created_at, metadata)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Value-to-member lookups for row enums; much cheaper than calling the Enum
+_PRD_STATUSES = {status.value: status for status in PRDStatus}
+_STORY_STATUSES = {status.value: status for status in StoryStatus}
+_TASK_STATUSES = {status.value: status for status in TaskStatus}
+_ENTITY_TYPES = {entity_type.value: entity_type for entity_type in EntityType}
+_COMMENT_TYPES = {comment_type.value: comment_type for comment_type in CommentType}
+
+# Per-connection tuning applied by Database(fast=True)
+_FAST_PRAGMAS = (
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -20000",
 )
 
+if orjson is not None:
+    # Pass through the types json cannot encode so they fail the same way
+    _ORJSON_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+    )
+
+# A run of digits long enough to be an integer outside the signed/unsigned
+# 64-bit range; -2**63 - 1 already has 19 digits
+_LONG_DIGITS = re.compile(r"-?\d{19,}")
+
+
+def _has_non_finite(value: Any) -> bool:
+    """Whether a JSON-like value holds NaN or an infinity anywhere."""
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(map(_has_non_finite, value)) or any(map(_has_non_finite, value.values()))
+    if isinstance(value, (list, tuple)):
+        return any(map(_has_non_finite, value))
+    return False
+
+
+def _json_dumps(value: Any) -> str:
+    """Encode a value as JSON, using orjson when it is installed.
+
+    The text differs between the two encoders, but it decodes to the same
+    values: anything orjson rejects or would change (integers over 64 bits,
+    NaN, infinities, datetimes) is encoded by json instead.
+    """
+    if orjson is not None and not _has_non_finite(value):
+        try:
+            return orjson.dumps(value, option=_ORJSON_OPTIONS).decode()
+        except orjson.JSONEncodeError:
+            # Beyond orjson (e.g. integers over 64 bits), or a type json rejects
+            pass
+    return json.dumps(value)
+
+
+def _json_loads(value: str) -> Any:
+    """Decode a JSON string, using orjson when it is installed."""
+    # orjson reads integers over 64 bits as floats and rejects NaN/Infinity
+    if orjson is not None and not _LONG_DIGITS.search(value):
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(value)
+
+
+@lru_cache(maxsize=32)
+def _list_sql(table: str, columns: tuple[str, ...]) -> str:
+    """Build the filtered list query for a table, once per set of filter columns."""
+    where_sql = " AND ".join(f"{column} = ?" for column in columns)
+    where_sql = f"WHERE {where_sql}" if where_sql else ""
+    return f"SELECT * FROM {table} {where_sql} ORDER BY created_at DESC LIMIT ? OFFSET ?"
+
 
 def get_data_dir() -> Path:
     """Get the data directory for noGojira."""
@@ -36,38 +157,152 @@ def get_db_path() -> Path:
     return get_data_dir() / "nogojira.db"
 
 
+class _PooledConnection:
+    """A thread's pooled connection; owned by that thread's local storage."""
+
+    __slots__ = ("conn", "__weakref__")
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+
+class _ConnectionPool:
+    """One reusable connection per thread, closed when its thread exits."""
+
+    def __init__(self, connect: Callable[[], sqlite3.Connection]):
+        self._connect = connect
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: set[sqlite3.Connection] = set()
+
+    def acquire(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it on first use."""
+        pooled = getattr(self._local, "pooled", None)
+        if pooled is None:
+            conn = self._connect()
+            pooled = _PooledConnection(conn)
+            with self._lock:
+                self._connections.add(conn)
+            # The thread-local drops its holder when the thread exits, which
+            # closes the connection instead of leaking it until close()
+            weakref.finalize(pooled, self._release, self._lock, self._connections, conn)
+            self._local.pooled = pooled
+        return pooled.conn
+
+    @staticmethod
+    def _release(
+        lock: threading.Lock, connections: set[sqlite3.Connection], conn: sqlite3.Connection
+    ) -> None:
+        """Forget and close a connection whose thread has gone away."""
+        with lock:
+            connections.discard(conn)
+        conn.close()
+
+    def close(self) -> None:
+        """Close every connection still open."""
+        with self._lock:
+            connections = list(self._connections)
+            self._connections.clear()
+        self._local = threading.local()
+        for conn in connections:
+            conn.close()
+
+
 class Database:
     """SQLite database manager for noGojira."""
 
-    def __init__(self, db_path: Path | None = None):
-        """Initialize database connection."""
+    def __init__(self, db_path: Path | str | None = None, fast: bool = False):
+        """Initialize database from a file path, a file: URI or ":memory:".
+
+        With ``fast=True`` the database runs in WAL mode with relaxed syncing,
+        trading durability on power loss for much cheaper commits.
+        """
         self.db_path = db_path or get_db_path()
-        self._ensure_data_dir()
+        self.fast = fast
+        self._keepalive: sqlite3.Connection | None = None
+        self._local = threading.local()
+        self._pool = _ConnectionPool(self._connect)
+        if os.fspath(self.db_path) == ":memory:":
+            # Every plain ":memory:" connection is a separate database, so use
+            # a uniquely named shared-cache database instead
+            self.db_path = f"file:nogojira-{uuid4().hex}?mode=memory&cache=shared"
+        self._uri = isinstance(self.db_path, str) and self.db_path.startswith("file:")
+        if self._uri:
+            if "mode=memory" in self.db_path:
+                # An in-memory database lives only while a connection is open
+                self._keepalive = sqlite3.connect(self.db_path, uri=True)
+        else:
+            self.db_path = Path(self.db_path)
+            self._ensure_data_dir()
         self._init_db()
 
+    def close(self) -> None:
+        """Close pooled connections and release an in-memory database."""
+        self._pool.close()
+        if self._keepalive is not None:
+            self._keepalive.close()
+            self._keepalive = None
+
     def _ensure_data_dir(self) -> None:
         """Ensure data directory exists."""
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
     @contextmanager
-    def _get_connection(self) -> Generator[sqlite3.Connection, None, None]:
-        """Context manager for database connections."""
-        conn = sqlite3.connect(str(self.db_path))
+    def transaction(self) -> Generator[None, None, None]:
+        """Run all operations in the block on one connection with one commit."""
+        if getattr(self._local, "conn", None) is not None:
+            # Already inside a transaction; join it
+            yield
+            return
+        with self._get_connection() as conn:
+            self._local.conn = conn
+            try:
+                yield
+            finally:
+                self._local.conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open and configure a new connection."""
+        # Pooled connections are closed from whichever thread calls close().
+        # They live long enough for sqlite3's per-connection statement cache to
+        # pay off; size it to hold every distinct query this class issues.
+        conn = sqlite3.connect(
+            str(self.db_path),
+            uri=self._uri,
+            check_same_thread=False,
+            cached_statements=256,
+        )
         conn.row_factory = sqlite3.Row
         # Enable foreign key constraints
         conn.execute("PRAGMA foreign_keys = ON")
+        if self.fast:
+            for pragma in _FAST_PRAGMAS:
+                conn.execute(pragma)
+        return conn
+
+    @contextmanager
+    def _get_connection(self) -> Generator[sqlite3.Connection, None, None]:
+        """Context manager for database connections."""
+        active = getattr(self._local, "conn", None)
+        if active is not None:
+            # Commit and rollback are left to the enclosing transaction()
+            yield active
+            return
+        conn = self._pool.acquire()
         try:
             yield conn
             conn.commit()
         except Exception:
             conn.rollback()
             raise
-        finally:
-            conn.close()
 
     def _init_db(self) -> None:
         """Initialize database schema."""
         with self._get_connection() as conn:
+            if self.fast:
+                # Persistent setting; ignored for in-memory databases
+                conn.execute("PRAGMA journal_mode = WAL")
+
             # Projects table
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS projects (
@@ -148,15 +383,30 @@ class Database:
             """)
 
             # Create indexes
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_projects_created_at ON projects(created_at, id)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_prds_project_id ON prds(project_id)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_prds_status ON prds(status)"
+            )
             conn.execute(
                 "CREATE INDEX IF NOT EXISTS idx_stories_prd_id ON stories(prd_id)"
             )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_stories_status ON stories(status)"
+            )
             conn.execute(
                 "CREATE INDEX IF NOT EXISTS idx_stories_assigned_to ON stories(assigned_to)"
             )
             conn.execute(
                 "CREATE INDEX IF NOT EXISTS idx_tasks_story_id ON tasks(story_id)"
             )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(status)"
+            )
             conn.execute(
                 "CREATE INDEX IF NOT EXISTS idx_tasks_assigned_to ON tasks(assigned_to)"
             )
@@ -164,43 +414,137 @@ class Database:
                 "CREATE INDEX IF NOT EXISTS idx_comments_entity ON comments(entity_type, entity_id)"
             )
 
+    def clear(self) -> None:
+        """Delete all rows from every table, keeping the schema."""
+        with self._get_connection() as conn:
+            # Children first so foreign keys are never violated
+            for table in ("comments", "tasks", "stories", "prds", "projects"):
+                conn.execute(f"DELETE FROM {table}")
+
     # Helper methods for serialization
     def _serialize_metadata(self, metadata: dict[str, Any]) -> str:
         """Serialize metadata dict to JSON string."""
-        return json.dumps(metadata)
+        return _json_dumps(metadata)
 
     def _deserialize_metadata(self, metadata_str: str) -> dict[str, Any]:
         """Deserialize metadata JSON string to dict."""
-        return json.loads(metadata_str) if metadata_str else {}
+        # Most rows carry the empty default; skip the parser for them
+        if not metadata_str or metadata_str == "{}":
+            return {}
+        return _json_loads(metadata_str)
 
     def _serialize_list(self, items: list[str]) -> str:
         """Serialize list to JSON string."""
-        return json.dumps(items)
+        return _json_dumps(items)
 
     def _deserialize_list(self, items_str: str) -> list[str]:
         """Deserialize JSON string to list."""
-        return json.loads(items_str) if items_str else []
+        if not items_str or items_str == "[]":
+            return []
+        return _json_loads(items_str)
+
+    # Row to model conversion
+    # Rows were validated when written, so models are built without
+    # re-validation; only the enum columns need converting.
+    def _project_from_row(self, row: sqlite3.Row) -> Project:
+        """Build a project from a database row."""
+        return Project.model_construct(
+            id=row["id"],
+            name=row["name"],
+            description=row["description"],
+            created_at=datetime.fromisoformat(row["created_at"]),
+            updated_at=datetime.fromisoformat(row["updated_at"]),
+            metadata=self._deserialize_metadata(row["metadata"]),
+        )
+
+    def _prd_from_row(self, row: sqlite3.Row) -> PRD:
+        """Build a PRD from a database row."""
+        return PRD.model_construct(
+            id=row["id"],
+            project_id=row["project_id"],
+            agent_id=row["created_by"],
+            created_by=row["created_by"],
+            title=row["title"],
+            description=row["description"],
+            status=_PRD_STATUSES[row["status"]],
+            created_at=datetime.fromisoformat(row["created_at"]),
+            updated_at=datetime.fromisoformat(row["updated_at"]),
+            metadata=self._deserialize_metadata(row["metadata"]),
+        )
+
+    def _story_from_row(self, row: sqlite3.Row) -> Story:
+        """Build a story from a database row."""
+        return Story.model_construct(
+            id=row["id"],
+            prd_id=row["prd_id"],
+            agent_id=row["agent_id"],
+            title=row["title"],
+            description=row["description"],
+            status=_STORY_STATUSES[row["status"]],
+            assigned_to=row["assigned_to"],
+            story_points=row["story_points"],
+            acceptance_criteria=row["acceptance_criteria"],
+            created_at=datetime.fromisoformat(row["created_at"]),
+            updated_at=datetime.fromisoformat(row["updated_at"]),
+            metadata=self._deserialize_metadata(row["metadata"]),
+        )
+
+    def _task_from_row(self, row: sqlite3.Row) -> Task:
+        """Build a task from a database row."""
+        return Task.model_construct(
+            id=row["id"],
+            story_id=row["story_id"],
+            agent_id=row["agent_id"],
+            title=row["title"],
+            description=row["description"],
+            status=_TASK_STATUSES[row["status"]],
+            assigned_to=row["assigned_to"],
+            depends_on=self._deserialize_list(row["depends_on"]),
+            created_at=datetime.fromisoformat(row["created_at"]),
+            updated_at=datetime.fromisoformat(row["updated_at"]),
+            metadata=self._deserialize_metadata(row["metadata"]),
+        )
+
+    def _comment_from_row(self, row: sqlite3.Row) -> Comment:
+        """Build a comment from a database row."""
+        return Comment.model_construct(
+            id=row["id"],
+            entity_type=_ENTITY_TYPES[row["entity_type"]],
+            entity_id=row["entity_id"],
+            agent_id=row["author"],
+            author=row["author"],
+            content=row["content"],
+            comment_type=_COMMENT_TYPES[row["comment_type"]],
+            created_at=datetime.fromisoformat(row["created_at"]),
+            metadata=self._deserialize_metadata(row["metadata"]),
+        )
 
     # Project CRUD operations
     def create_project(self, project: Project) -> Project:
         """Create a new project."""
         with self._get_connection() as conn:
-            conn.execute(
-                """
-                INSERT INTO projects (id, name, description, created_at, updated_at, metadata)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    project.id,
-                    project.name,
-                    project.description,
-                    project.created_at.isoformat(),
-                    project.updated_at.isoformat(),
-                    self._serialize_metadata(project.metadata),
-                ),
-            )
+            conn.execute(_INSERT_PROJECT_SQL, self._project_params(project))
         return project
 
+    def create_projects_bulk(self, projects: list[Project]) -> list[Project]:
+        """Create many projects in a single transaction."""
+        with self._get_connection() as conn:
+            conn.executemany(
+                _INSERT_PROJECT_SQL, [self._project_params(item) for item in projects]
+            )
+        return projects
+
+    def _project_params(self, project: Project) -> tuple[Any, ...]:
+        """Build INSERT parameters for a project."""
+        return (
+            project.id,
+            project.name,
+            project.description,
+            project.created_at.isoformat(),
+            project.updated_at.isoformat(),
+            self._serialize_metadata(project.metadata),
+        )
+
     def get_project(self, project_id: str) -> Project | None:
         """Get a project by ID."""
         with self._get_connection() as conn:
@@ -210,33 +554,70 @@ class Database:
             )
             row = cursor.fetchone()
             if row:
-                return Project(
-                    id=row["id"],
-                    name=row["name"],
-                    description=row["description"],
-                    created_at=datetime.fromisoformat(row["created_at"]),
-                    updated_at=datetime.fromisoformat(row["updated_at"]),
-                    metadata=self._deserialize_metadata(row["metadata"]),
-                )
+                return self._project_from_row(row)
             return None
 
-    def list_projects(self, limit: int = 50, offset: int = 0) -> list[Project]:
-        """List all projects with pagination."""
+    def list_projects(
+        self,
+        limit: int = 50,
+        offset: int = 0,
+        after: tuple[datetime, str] | None = None,
+    ) -> list[Project]:
+        """List all projects with pagination.
+
+        Pass the ``(created_at, id)`` of the last project of the previous page
+        as ``after`` to seek straight to the next page instead of using OFFSET.
+        """
+        with self._get_connection() as conn:
+            if after is None:
+                cursor = conn.execute(
+                    "SELECT * FROM projects ORDER BY created_at DESC, id DESC"
+                    " LIMIT ? OFFSET ?",
+                    (limit, offset),
+                )
+            else:
+                cursor = conn.execute(
+                    """
+                    SELECT * FROM projects WHERE (created_at, id) < (?, ?)
+                    ORDER BY created_at DESC, id DESC LIMIT ? OFFSET ?
+                    """,
+                    (after[0].isoformat(), after[1], limit, offset),
+                )
+            return [self._project_from_row(row) for row in cursor.fetchall()]
+
+    def list_projects_with_counts(
+        self, limit: int = 50, offset: int = 0
+    ) -> list[ProjectWithStats]:
+        """List projects with PRD, story and task counts in a single query."""
         with self._get_connection() as conn:
             cursor = conn.execute(
-                "SELECT * FROM projects ORDER BY created_at DESC LIMIT ? OFFSET ?",
+                """
+                SELECT p.*,
+                       COUNT(DISTINCT r.id) as prd_count,
+                       COUNT(DISTINCT s.id) as story_count,
+                       COUNT(DISTINCT t.id) as task_count
+                FROM projects p
+                LEFT JOIN prds r ON r.project_id = p.id
+                LEFT JOIN stories s ON s.prd_id = r.id
+                LEFT JOIN tasks t ON t.story_id = s.id
+                GROUP BY p.id
+                ORDER BY p.created_at DESC LIMIT ? OFFSET ?
+                """,
                 (limit, offset),
             )
             projects = []
             for row in cursor.fetchall():
                 projects.append(
-                    Project(
+                    ProjectWithStats.model_construct(
                         id=row["id"],
                         name=row["name"],
                         description=row["description"],
                         created_at=datetime.fromisoformat(row["created_at"]),
                         updated_at=datetime.fromisoformat(row["updated_at"]),
                         metadata=self._deserialize_metadata(row["metadata"]),
+                        prd_count=row["prd_count"],
+                        story_count=row["story_count"],
+                        task_count=row["task_count"],
                     )
                 )
             return projects
@@ -266,38 +647,43 @@ class Database:
             values.append(datetime.utcnow().isoformat())
             values.append(project_id)
 
-            conn.execute(
-                f"UPDATE projects SET {', '.join(set_clauses)} WHERE id = ?",
+            # RETURNING hands back the updated row without a second SELECT
+            row = conn.execute(
+                f"UPDATE projects SET {', '.join(set_clauses)} WHERE id = ? RETURNING *",
                 values,
-            )
+            ).fetchone()
 
-        return self.get_project(project_id)
+        return self._project_from_row(row) if row else None
 
     # PRD CRUD operations
     def create_prd(self, prd: PRD) -> PRD:
         """Create a new PRD."""
         with self._get_connection() as conn:
-            conn.execute(
-                """
-                INSERT INTO prds
-                (id, project_id, title, description, status, created_by,
-                 created_at, updated_at, metadata)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    prd.id,
-                    prd.project_id,
-                    prd.title,
-                    prd.description,
-                    prd.status.value,
-                    prd.created_by,
-                    prd.created_at.isoformat(),
-                    prd.updated_at.isoformat(),
-                    self._serialize_metadata(prd.metadata),
-                ),
-            )
+            conn.execute(_INSERT_PRD_SQL, self._prd_params(prd))
         return prd
 
+    def create_prds_bulk(self, prds: list[PRD]) -> list[PRD]:
+        """Create many PRDs in a single transaction."""
+        with self._get_connection() as conn:
+            conn.executemany(
+                _INSERT_PRD_SQL, [self._prd_params(item) for item in prds]
+            )
+        return prds
+
+    def _prd_params(self, prd: PRD) -> tuple[Any, ...]:
+        """Build INSERT parameters for a PRD."""
+        return (
+            prd.id,
+            prd.project_id,
+            prd.title,
+            prd.description,
+            prd.status.value,
+            prd.created_by,
+            prd.created_at.isoformat(),
+            prd.updated_at.isoformat(),
+            self._serialize_metadata(prd.metadata),
+        )
+
     def get_prd(self, prd_id: str) -> PRD | None:
         """Get a PRD by ID."""
         with self._get_connection() as conn:
@@ -307,18 +693,7 @@ class Database:
             )
             row = cursor.fetchone()
             if row:
-                return PRD(
-                    id=row["id"],
-                    project_id=row["project_id"],
-                    agent_id=row["created_by"],
-                    created_by=row["created_by"],
-                    title=row["title"],
-                    description=row["description"],
-                    status=row["status"],
-                    created_at=datetime.fromisoformat(row["created_at"]),
-                    updated_at=datetime.fromisoformat(row["updated_at"]),
-                    metadata=self._deserialize_metadata(row["metadata"]),
-                )
+                return self._prd_from_row(row)
             return None
 
     def list_prds(
@@ -331,44 +706,14 @@ class Database:
     ) -> list[PRD]:
         """List PRDs with optional filters."""
         with self._get_connection() as conn:
-            where_clauses = []
-            values = []
-
-            if project_id:
-                where_clauses.append("project_id = ?")
-                values.append(project_id)
-            if status:
-                where_clauses.append("status = ?")
-                values.append(status)
-            if created_by:
-                where_clauses.append("created_by = ?")
-                values.append(created_by)
-
-            where_sql = f"WHERE {' AND '.join(where_clauses)}" if where_clauses else ""
+            filters = {"project_id": project_id, "status": status, "created_by": created_by}
+            columns = tuple(name for name, value in filters.items() if value)
+            values = [filters[name] for name in columns]
             values.extend([limit, offset])
 
-            cursor = conn.execute(
-                f"SELECT * FROM prds {where_sql} ORDER BY created_at DESC LIMIT ? OFFSET ?",
-                values,
-            )
+            cursor = conn.execute(_list_sql("prds", columns), values)
 
-            prds = []
-            for row in cursor.fetchall():
-                prds.append(
-                    PRD(
-                        id=row["id"],
-                        project_id=row["project_id"],
-                        agent_id=row["created_by"],
-                        created_by=row["created_by"],
-                        title=row["title"],
-                        description=row["description"],
-                        status=row["status"],
-                        created_at=datetime.fromisoformat(row["created_at"]),
-                        updated_at=datetime.fromisoformat(row["updated_at"]),
-                        metadata=self._deserialize_metadata(row["metadata"]),
-                    )
-                )
-            return prds
+            return [self._prd_from_row(row) for row in cursor.fetchall()]
 
     def update_prd(self, prd_id: str, updates: dict[str, Any]) -> PRD | None:
         """Update a PRD."""
@@ -400,41 +745,45 @@ class Database:
             values.append(datetime.utcnow().isoformat())
             values.append(prd_id)
 
-            conn.execute(
-                f"UPDATE prds SET {', '.join(set_clauses)} WHERE id = ?",
+            row = conn.execute(
+                f"UPDATE prds SET {', '.join(set_clauses)} WHERE id = ? RETURNING *",
                 values,
-            )
+            ).fetchone()
 
-        return self.get_prd(prd_id)
+        return self._prd_from_row(row) if row else None
 
     # Story CRUD operations
     def create_story(self, story: Story) -> Story:
         """Create a new story."""
         with self._get_connection() as conn:
-            conn.execute(
-                """
-                INSERT INTO stories
-                (id, prd_id, agent_id, title, description, status, assigned_to,
-                 story_points, acceptance_criteria, created_at, updated_at, metadata)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    story.id,
-                    story.prd_id,
-                    story.agent_id,
-                    story.title,
-                    story.description,
-                    story.status.value,
-                    story.assigned_to,
-                    story.story_points,
-                    story.acceptance_criteria,
-                    story.created_at.isoformat(),
-                    story.updated_at.isoformat(),
-                    self._serialize_metadata(story.metadata),
-                ),
-            )
+            conn.execute(_INSERT_STORY_SQL, self._story_params(story))
         return story
 
+    def create_stories_bulk(self, stories: list[Story]) -> list[Story]:
+        """Create many stories in a single transaction."""
+        with self._get_connection() as conn:
+            conn.executemany(
+                _INSERT_STORY_SQL, [self._story_params(item) for item in stories]
+            )
+        return stories
+
+    def _story_params(self, story: Story) -> tuple[Any, ...]:
+        """Build INSERT parameters for a story."""
+        return (
+            story.id,
+            story.prd_id,
+            story.agent_id,
+            story.title,
+            story.description,
+            story.status.value,
+            story.assigned_to,
+            story.story_points,
+            story.acceptance_criteria,
+            story.created_at.isoformat(),
+            story.updated_at.isoformat(),
+            self._serialize_metadata(story.metadata),
+        )
+
     def get_story(self, story_id: str) -> Story | None:
         """Get a story by ID."""
         with self._get_connection() as conn:
@@ -444,20 +793,7 @@ class Database:
             )
             row = cursor.fetchone()
             if row:
-                return Story(
-                    id=row["id"],
-                    prd_id=row["prd_id"],
-                    agent_id=row["agent_id"],
-                    title=row["title"],
-                    description=row["description"],
-                    status=row["status"],
-                    assigned_to=row["assigned_to"],
-                    story_points=row["story_points"],
-                    acceptance_criteria=row["acceptance_criteria"],
-                    created_at=datetime.fromisoformat(row["created_at"]),
-                    updated_at=datetime.fromisoformat(row["updated_at"]),
-                    metadata=self._deserialize_metadata(row["metadata"]),
-                )
+                return self._story_from_row(row)
             return None
 
     def list_stories(
@@ -470,46 +806,14 @@ class Database:
     ) -> list[Story]:
         """List stories with optional filters."""
         with self._get_connection() as conn:
-            where_clauses = []
-            values = []
-
-            if prd_id:
-                where_clauses.append("prd_id = ?")
-                values.append(prd_id)
-            if status:
-                where_clauses.append("status = ?")
-                values.append(status)
-            if assigned_to:
-                where_clauses.append("assigned_to = ?")
-                values.append(assigned_to)
-
-            where_sql = f"WHERE {' AND '.join(where_clauses)}" if where_clauses else ""
+            filters = {"prd_id": prd_id, "status": status, "assigned_to": assigned_to}
+            columns = tuple(name for name, value in filters.items() if value)
+            values = [filters[name] for name in columns]
             values.extend([limit, offset])
 
-            cursor = conn.execute(
-                f"SELECT * FROM stories {where_sql} ORDER BY created_at DESC LIMIT ? OFFSET ?",
-                values,
-            )
+            cursor = conn.execute(_list_sql("stories", columns), values)
 
-            stories = []
-            for row in cursor.fetchall():
-                stories.append(
-                    Story(
-                        id=row["id"],
-                        prd_id=row["prd_id"],
-                        agent_id=row["agent_id"],
-                        title=row["title"],
-                        description=row["description"],
-                        status=row["status"],
-                        assigned_to=row["assigned_to"],
-                        story_points=row["story_points"],
-                        acceptance_criteria=row["acceptance_criteria"],
-                        created_at=datetime.fromisoformat(row["created_at"]),
-                        updated_at=datetime.fromisoformat(row["updated_at"]),
-                        metadata=self._deserialize_metadata(row["metadata"]),
-                    )
-                )
-            return stories
+            return [self._story_from_row(row) for row in cursor.fetchall()]
 
     def update_story(self, story_id: str, updates: dict[str, Any]) -> Story | None:
         """Update a story."""
@@ -550,40 +854,44 @@ class Database:
             values.append(datetime.utcnow().isoformat())
             values.append(story_id)
 
-            conn.execute(
-                f"UPDATE stories SET {', '.join(set_clauses)} WHERE id = ?",
+            row = conn.execute(
+                f"UPDATE stories SET {', '.join(set_clauses)} WHERE id = ? RETURNING *",
                 values,
-            )
+            ).fetchone()
 
-        return self.get_story(story_id)
+        return self._story_from_row(row) if row else None
 
     # Task CRUD operations
     def create_task(self, task: Task) -> Task:
         """Create a new task."""
         with self._get_connection() as conn:
-            conn.execute(
-                """
-                INSERT INTO tasks
-                (id, story_id, agent_id, title, description, status, assigned_to,
-                 depends_on, created_at, updated_at, metadata)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    task.id,
-                    task.story_id,
-                    task.agent_id,
-                    task.title,
-                    task.description,
-                    task.status.value,
-                    task.assigned_to,
-                    self._serialize_list(task.depends_on),
-                    task.created_at.isoformat(),
-                    task.updated_at.isoformat(),
-                    self._serialize_metadata(task.metadata),
-                ),
-            )
+            conn.execute(_INSERT_TASK_SQL, self._task_params(task))
         return task
 
+    def create_tasks_bulk(self, tasks: list[Task]) -> list[Task]:
+        """Create many tasks in a single transaction."""
+        with self._get_connection() as conn:
+            conn.executemany(
+                _INSERT_TASK_SQL, [self._task_params(item) for item in tasks]
+            )
+        return tasks
+
+    def _task_params(self, task: Task) -> tuple[Any, ...]:
+        """Build INSERT parameters for a task."""
+        return (
+            task.id,
+            task.story_id,
+            task.agent_id,
+            task.title,
+            task.description,
+            task.status.value,
+            task.assigned_to,
+            self._serialize_list(task.depends_on),
+            task.created_at.isoformat(),
+            task.updated_at.isoformat(),
+            self._serialize_metadata(task.metadata),
+        )
+
     def get_task(self, task_id: str) -> Task | None:
         """Get a task by ID."""
         with self._get_connection() as conn:
@@ -593,19 +901,7 @@ class Database:
             )
             row = cursor.fetchone()
             if row:
-                return Task(
-                    id=row["id"],
-                    story_id=row["story_id"],
-                    agent_id=row["agent_id"],
-                    title=row["title"],
-                    description=row["description"],
-                    status=row["status"],
-                    assigned_to=row["assigned_to"],
-                    depends_on=self._deserialize_list(row["depends_on"]),
-                    created_at=datetime.fromisoformat(row["created_at"]),
-                    updated_at=datetime.fromisoformat(row["updated_at"]),
-                    metadata=self._deserialize_metadata(row["metadata"]),
-                )
+                return self._task_from_row(row)
             return None
 
     def list_tasks(
@@ -618,45 +914,14 @@ class Database:
     ) -> list[Task]:
         """List tasks with optional filters."""
         with self._get_connection() as conn:
-            where_clauses = []
-            values = []
-
-            if story_id:
-                where_clauses.append("story_id = ?")
-                values.append(story_id)
-            if status:
-                where_clauses.append("status = ?")
-                values.append(status)
-            if assigned_to:
-                where_clauses.append("assigned_to = ?")
-                values.append(assigned_to)
-
-            where_sql = f"WHERE {' AND '.join(where_clauses)}" if where_clauses else ""
+            filters = {"story_id": story_id, "status": status, "assigned_to": assigned_to}
+            columns = tuple(name for name, value in filters.items() if value)
+            values = [filters[name] for name in columns]
             values.extend([limit, offset])
 
-            cursor = conn.execute(
-                f"SELECT * FROM tasks {where_sql} ORDER BY created_at DESC LIMIT ? OFFSET ?",
-                values,
-            )
+            cursor = conn.execute(_list_sql("tasks", columns), values)
 
-            tasks = []
-            for row in cursor.fetchall():
-                tasks.append(
-                    Task(
-                        id=row["id"],
-                        story_id=row["story_id"],
-                        agent_id=row["agent_id"],
-                        title=row["title"],
-                        description=row["description"],
-                        status=row["status"],
-                        assigned_to=row["assigned_to"],
-                        depends_on=self._deserialize_list(row["depends_on"]),
-                        created_at=datetime.fromisoformat(row["created_at"]),
-                        updated_at=datetime.fromisoformat(row["updated_at"]),
-                        metadata=self._deserialize_metadata(row["metadata"]),
-                    )
-                )
-            return tasks
+            return [self._task_from_row(row) for row in cursor.fetchall()]
 
     def update_task(self, task_id: str, updates: dict[str, Any]) -> Task | None:
         """Update a task."""
@@ -694,37 +959,54 @@ class Database:
             values.append(datetime.utcnow().isoformat())
             values.append(task_id)
 
-            conn.execute(
-                f"UPDATE tasks SET {', '.join(set_clauses)} WHERE id = ?",
+            row = conn.execute(
+                f"UPDATE tasks SET {', '.join(set_clauses)} WHERE id = ? RETURNING *",
                 values,
-            )
-
-        return self.get_task(task_id)
+            ).fetchone()
+
+        return self._task_from_row(row) if row else None
+
+    def update_task_statuses(self, updates: list[tuple[str, TaskStatus]]) -> list[str]:
+        """Set the status of many tasks in one batch; return the IDs that exist."""
+        updated_at = datetime.utcnow().isoformat()
+        with self.transaction():
+            found = self.existing_ids("tasks", {task_id for task_id, _ in updates})
+            applied = [(task_id, status) for task_id, status in updates if task_id in found]
+            with self._get_connection() as conn:
+                conn.executemany(
+                    "UPDATE tasks SET status = ?, updated_at = ? WHERE id = ?",
+                    [(status.value, updated_at, task_id) for task_id, status in applied],
+                )
+        return [task_id for task_id, _ in applied]
 
     # Comment operations
     def create_comment(self, comment: Comment) -> Comment:
         """Create a new comment."""
         with self._get_connection() as conn:
-            conn.execute(
-                """
-                INSERT INTO comments
-                (id, entity_type, entity_id, author, content, comment_type,
-                 created_at, metadata)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    comment.id,
-                    comment.entity_type.value,
-                    comment.entity_id,
-                    comment.author,
-                    comment.content,
-                    comment.comment_type.value,
-                    comment.created_at.isoformat(),
-                    self._serialize_metadata(comment.metadata),
-                ),
-            )
+            conn.execute(_INSERT_COMMENT_SQL, self._comment_params(comment))
         return comment
 
+    def create_comments_bulk(self, comments: list[Comment]) -> list[Comment]:
+        """Create many comments in a single transaction."""
+        with self._get_connection() as conn:
+            conn.executemany(
+                _INSERT_COMMENT_SQL, [self._comment_params(item) for item in comments]
+            )
+        return comments
+
+    def _comment_params(self, comment: Comment) -> tuple[Any, ...]:
+        """Build INSERT parameters for a comment."""
+        return (
+            comment.id,
+            comment.entity_type.value,
+            comment.entity_id,
+            comment.author,
+            comment.content,
+            comment.comment_type.value,
+            comment.created_at.isoformat(),
+            self._serialize_metadata(comment.metadata),
+        )
+
     def get_comments(
         self,
         entity_type: EntityType,
@@ -743,78 +1025,100 @@ class Database:
                 (entity_type.value, entity_id, limit, offset),
             )
 
-            comments = []
-            for row in cursor.fetchall():
-                comments.append(
-                    Comment(
-                        id=row["id"],
-                        entity_type=row["entity_type"],
-                        entity_id=row["entity_id"],
-                        agent_id=row["author"],
-                        author=row["author"],
-                        content=row["content"],
-                        comment_type=row["comment_type"],
-                        created_at=datetime.fromisoformat(row["created_at"]),
-                        metadata=self._deserialize_metadata(row["metadata"]),
-                    )
-                )
-            return comments
+            return [self._comment_from_row(row) for row in cursor.fetchall()]
+
+    # Existence checks
+    def existing_ids(self, table: str, ids: set[str]) -> set[str]:
+        """Return which of the given IDs exist in a table, in one query."""
+        if not ids:
+            return set()
+        with self._get_connection() as conn:
+            cursor = conn.execute(
+                f"SELECT id FROM {table} WHERE id IN (SELECT value FROM json_each(?))",
+                (_json_dumps(list(ids)),),
+            )
+            return {row["id"] for row in cursor}
 
     # Statistics and aggregation queries
     def get_project_stats(self, project_id: str) -> dict[str, int]:
         """Get statistics for a project."""
         with self._get_connection() as conn:
-            # Count PRDs
             cursor = conn.execute(
-                "SELECT COUNT(*) as count FROM prds WHERE project_id = ?",
-                (project_id,),
+                """
+                SELECT
+                    (SELECT COUNT(*) FROM prds WHERE project_id = :project_id)
+                        as prd_count,
+                    (SELECT COUNT(*) FROM stories
+                     WHERE prd_id IN (SELECT id FROM prds WHERE project_id = :project_id))
+                        as story_count,
+                    (SELECT COUNT(*) FROM tasks
+                     WHERE story_id IN (
+                         SELECT id FROM stories WHERE prd_id IN (
+                             SELECT id FROM prds WHERE project_id = :project_id
+                         )
+                     ))
+                        as task_count
+                """,
+                {"project_id": project_id},
             )
-            prd_count = cursor.fetchone()["count"]
+            row = cursor.fetchone()
 
-            # Count Stories
-            cursor = conn.execute(
+            return {
+                "prd_count": row["prd_count"],
+                "story_count": row["story_count"],
+                "task_count": row["task_count"],
+            }
+
+    def get_project_breakdown(self, project_id: str) -> dict[str, dict[str, int]]:
+        """Get story and task counts grouped by status and task counts by assignee."""
+        stories_by_status: dict[str, int] = {}
+        tasks_by_status: dict[str, int] = {}
+        tasks_by_agent: dict[str, int] = {}
+        with self._get_connection() as conn:
+            for row in conn.execute(
                 """
-                SELECT COUNT(*) as count FROM stories
+                SELECT status, COUNT(*) as count FROM stories
                 WHERE prd_id IN (SELECT id FROM prds WHERE project_id = ?)
+                GROUP BY status
                 """,
                 (project_id,),
-            )
-            story_count = cursor.fetchone()["count"]
+            ):
+                stories_by_status[row["status"]] = row["count"]
 
-            # Count Tasks
-            cursor = conn.execute(
+            for row in conn.execute(
                 """
-                SELECT COUNT(*) as count FROM tasks
+                SELECT status, assigned_to, COUNT(*) as count FROM tasks
                 WHERE story_id IN (
                     SELECT id FROM stories WHERE prd_id IN (
                         SELECT id FROM prds WHERE project_id = ?
                     )
                 )
+                GROUP BY status, assigned_to
                 """,
                 (project_id,),
-            )
-            task_count = cursor.fetchone()["count"]
+            ):
+                status, agent, count = row["status"], row["assigned_to"], row["count"]
+                tasks_by_status[status] = tasks_by_status.get(status, 0) + count
+                tasks_by_agent[agent] = tasks_by_agent.get(agent, 0) + count
 
-            return {
-                "prd_count": prd_count,
-                "story_count": story_count,
-                "task_count": task_count,
-            }
+        return {
+            "stories_by_status": stories_by_status,
+            "tasks_by_status": tasks_by_status,
+            "tasks_by_agent": tasks_by_agent,
+        }
 
     def get_story_task_counts(self, story_id: str) -> tuple[int, int]:
         """Get total and completed task counts for a story."""
         with self._get_connection() as conn:
             cursor = conn.execute(
-                "SELECT COUNT(*) as count FROM tasks WHERE story_id = ?",
-                (story_id,),
-            )
-            total = cursor.fetchone()["count"]
-
-            cursor = conn.execute(
-                "SELECT COUNT(*) as count FROM tasks WHERE story_id = ? AND status = 'done'",
+                """
+                SELECT COUNT(*) as total,
+                       COALESCE(SUM(CASE WHEN status = 'done' THEN 1 ELSE 0 END), 0)
+                           as completed
+                FROM tasks WHERE story_id = ?
+                """,
                 (story_id,),
             )
-            completed = cursor.fetchone()["count"]
-
-            return total, completed
+            row = cursor.fetchone()
 
+            return row["total"], row["completed"]
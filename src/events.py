@@ -1,15 +1,27 @@
 """Event system for tracking all changes in noGojira."""
 
 import json
+import time
 from collections import deque
-from datetime import datetime, timezone
-from enum import Enum
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from enum import Enum, unique
+from functools import cache
+from itertools import islice
 from threading import Lock
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from pydantic import BaseModel, Field
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
+if TYPE_CHECKING:
+    from pydantic import TypeAdapter
 
+
+@unique
 class EventType(str, Enum):
     """Types of events that can occur."""
 
@@ -38,77 +50,214 @@ class EventType(str, Enum):
     COMMENT_CREATED = "comment.created"
 
 
-class Event(BaseModel):
-    """An event in the system."""
+# Display verbs for to_display_string; other types fall back to their value
+_ACTIONS = {
+    EventType.PROJECT_CREATED: "created project",
+    EventType.PRD_CREATED: "created PRD",
+    EventType.STORY_CREATED: "created story",
+    EventType.TASK_CREATED: "created task",
+    EventType.TASK_STATUS_CHANGED: "updated task status",
+    EventType.STORY_STATUS_CHANGED: "updated story status",
+    EventType.PRD_STATUS_CHANGED: "updated PRD status",
+    EventType.COMMENT_CREATED: "added comment",
+}
+
+
+@dataclass(slots=True, kw_only=True)
+class Event:
+    """An event in the system.
+
+    Constructed directly by internal callers; use ``model_validate`` for
+    untrusted input and ``from_timestamp`` to stamp it with a datetime.
+    """
 
-    id: str = Field(default_factory=lambda: str(datetime.now(timezone.utc).timestamp()))
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    id: str = field(default_factory=lambda: str(time.time()))
+    # Wall-clock nanoseconds; the datetime is only built when read
+    timestamp_ns: int = field(default_factory=time.time_ns)
     event_type: EventType
     agent_id: str
     entity_type: str  # project, prd, story, task, comment
     entity_id: str
     entity_name: str | None = None
-    details: dict[str, Any] = Field(default_factory=dict)
+    details: dict[str, Any] = field(default_factory=dict)
+    _short_id: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute the short ID shown when entity_name is missing."""
+        self._short_id = self.entity_id[:8]
+
+    @property
+    def timestamp(self) -> datetime:
+        """When the event happened, as an aware UTC datetime."""
+        seconds, nanos = divmod(self.timestamp_ns, 1_000_000_000)
+        return datetime.fromtimestamp(seconds, tz=timezone.utc).replace(microsecond=nanos // 1000)
+
+    @classmethod
+    def from_timestamp(cls, timestamp: datetime | str, **fields: Any) -> "Event":
+        """Build an event at a datetime or ISO string (naive means UTC)."""
+        return cls(timestamp_ns=_datetime_to_ns(timestamp), **fields)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert event to a JSON-compatible dict."""
+        return {
+            "id": self.id,
+            "timestamp": self.timestamp.isoformat(),
+            "event_type": self.event_type.value,
+            "agent_id": self.agent_id,
+            "entity_type": self.entity_type,
+            "entity_id": self.entity_id,
+            "entity_name": self.entity_name,
+            "details": self.details,
+        }
+
+    def to_json(self) -> bytes:
+        """Serialize event for broadcasting, using orjson when it is installed."""
+        if orjson is not None:
+            return orjson.dumps(self.to_dict(), option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(self.to_dict()).encode()
+
+    @classmethod
+    def model_validate(cls, data: dict[str, Any]) -> "Event":
+        """Validate and coerce external data into an event.
+
+        A ``timestamp`` key, as written by ``to_dict``, sets ``timestamp_ns``.
+        """
+        if "timestamp" in data:
+            data = dict(data)
+            timestamp = _datetime_adapter().validate_python(data.pop("timestamp"))
+            data["timestamp_ns"] = _datetime_to_ns(timestamp)
+        return _event_adapter().validate_python(data)
 
     def to_display_string(self) -> str:
         """Convert event to human-readable string."""
-        action_map = {
-            EventType.PROJECT_CREATED: "created project",
-            EventType.PRD_CREATED: "created PRD",
-            EventType.STORY_CREATED: "created story",
-            EventType.TASK_CREATED: "created task",
-            EventType.TASK_STATUS_CHANGED: "updated task status",
-            EventType.STORY_STATUS_CHANGED: "updated story status",
-            EventType.PRD_STATUS_CHANGED: "updated PRD status",
-            EventType.COMMENT_CREATED: "added comment",
-        }
-        action = action_map.get(self.event_type, self.event_type.value)
-        name = self.entity_name or self.entity_id[:8]
+        action = _ACTIONS.get(self.event_type, self.event_type.value)
+        name = self.entity_name or self._short_id
         return f"{self.agent_id} {action}: {name}"
 
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _datetime_to_ns(value: datetime | str) -> int:
+    """Convert a datetime or ISO string to nanoseconds since the epoch (naive is UTC)."""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return (value - _EPOCH) // timedelta(microseconds=1) * 1000
+
+
+@cache
+def _event_adapter() -> "TypeAdapter[Event]":
+    """Build the validator for Event on first use."""
+    from pydantic import TypeAdapter
+
+    return TypeAdapter(Event)
+
+
+@cache
+def _datetime_adapter() -> "TypeAdapter[datetime]":
+    """Build the validator for event timestamps on first use."""
+    from pydantic import TypeAdapter
+
+    return TypeAdapter(datetime)
+
+
 class EventQueue:
     """Thread-safe event queue with maximum size."""
 
     def __init__(self, maxlen: int = 1000):
         """Initialize event queue."""
-        self._queue: deque[Event] = deque(maxlen=maxlen)
+        if maxlen < 0:
+            raise ValueError("maxlen must be non-negative")
+        # Preallocated ring; _head counts every push, so the newest event
+        # sits at (_head - 1) % maxlen
+        self._maxlen = maxlen
+        self._buffer: list[Event | None] = [None] * maxlen
+        self._head = 0
+        # Per-agent and per-entity views of the ring, oldest first
+        self._by_agent: dict[str, deque[Event]] = {}
+        self._by_entity: dict[tuple[str, str], deque[Event]] = {}
         self._lock = Lock()
 
     def push(self, event: Event) -> None:
         """Add event to queue."""
         with self._lock:
-            self._queue.append(event)
+            self._append(event)
+
+    def push_many(self, events: Iterable[Event]) -> None:
+        """Add several events to the queue under a single lock acquisition."""
+        with self._lock:
+            for event in events:
+                self._append(event)
+
+    def _append(self, event: Event) -> None:
+        """Write an event into the ring and indexes. Caller must hold the lock."""
+        if not self._maxlen:
+            # Like deque(maxlen=0): accept the event and keep nothing
+            return
+        slot = self._head % self._maxlen
+        evicted = self._buffer[slot]
+        if evicted is not None:
+            # The evicted event is the oldest overall, so also in its buckets
+            self._unindex(self._by_agent, evicted.agent_id)
+            self._unindex(self._by_entity, (evicted.entity_type, evicted.entity_id))
+        self._buffer[slot] = event
+        self._head += 1
+        self._by_agent.setdefault(event.agent_id, deque()).append(event)
+        self._by_entity.setdefault((event.entity_type, event.entity_id), deque()).append(event)
+
+    @staticmethod
+    def _unindex(index: dict[Any, deque[Event]], key: Any) -> None:
+        """Drop the oldest event from an index bucket."""
+        bucket = index[key]
+        bucket.popleft()
+        if not bucket:
+            del index[key]
+
+    def _newest_first(self, limit: int | None = None) -> Iterator[Event]:
+        """Iterate over held events, newest first. Caller must hold the lock."""
+        stop = max(self._head - self._maxlen, 0)
+        if limit is not None:
+            stop = max(stop, self._head - limit)
+        buffer, maxlen = self._buffer, self._maxlen
+        for i in range(self._head - 1, stop - 1, -1):
+            yield buffer[i % maxlen]
+
+    def size(self) -> int:
+        """Number of events currently held."""
+        with self._lock:
+            return min(self._head, self._maxlen)
+
+    def latest(self) -> Event | None:
+        """Get the newest event without copying the queue, or None if empty."""
+        with self._lock:
+            if not self._head:
+                return None
+            return self._buffer[(self._head - 1) % self._maxlen]
 
     def get_recent(self, limit: int = 50) -> list[Event]:
         """Get recent events (newest first)."""
         with self._lock:
-            events = list(self._queue)
-            events.reverse()  # Newest first
-            return events[:limit]
+            return list(self._newest_first(limit))
 
     def get_by_agent(self, agent_id: str, limit: int = 50) -> list[Event]:
         """Get events for specific agent."""
         with self._lock:
-            events = [e for e in self._queue if e.agent_id == agent_id]
-            events.reverse()
-            return events[:limit]
+            return list(islice(reversed(self._by_agent.get(agent_id, ())), limit))
 
     def get_by_entity(self, entity_type: str, entity_id: str) -> list[Event]:
         """Get events for specific entity."""
         with self._lock:
-            events = [
-                e
-                for e in self._queue
-                if e.entity_type == entity_type and e.entity_id == entity_id
-            ]
-            events.reverse()
-            return events
+            return list(reversed(self._by_entity.get((entity_type, entity_id), ())))
 
     def clear(self) -> None:
         """Clear all events."""
         with self._lock:
-            self._queue.clear()
+            self._buffer = [None] * self._maxlen
+            self._head = 0
+            self._by_agent.clear()
+            self._by_entity.clear()
 
 
 # Global event queue
@@ -1,14 +1,15 @@
 """Data models for agentFlow using Pydantic v2."""
 
+import os
 from datetime import datetime, timezone
-from enum import Enum
-from typing import Any
-from uuid import uuid4
+from enum import Enum, unique
+from typing import Annotated, Any
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import AfterValidator, BaseModel, Field, field_validator
 
 
 # Enums for status fields
+@unique
 class PRDStatus(str, Enum):
     """Valid statuses for PRD."""
 
@@ -18,6 +19,7 @@ class PRDStatus(str, Enum):
     ARCHIVED = "archived"
 
 
+@unique
 class StoryStatus(str, Enum):
     """Valid statuses for Story."""
 
@@ -28,6 +30,7 @@ class StoryStatus(str, Enum):
     ARCHIVED = "archived"
 
 
+@unique
 class TaskStatus(str, Enum):
     """Valid statuses for Task."""
 
@@ -39,6 +42,7 @@ class TaskStatus(str, Enum):
     ARCHIVED = "archived"
 
 
+@unique
 class CommentType(str, Enum):
     """Valid types for Comment."""
 
@@ -48,6 +52,7 @@ class CommentType(str, Enum):
     BLOCKER = "blocker"
 
 
+@unique
 class EntityType(str, Enum):
     """Valid entity types for comments."""
 
@@ -56,12 +61,21 @@ class EntityType(str, Enum):
     TASK = "task"
 
 
-# Helper function for UTC timestamps
+# Helpers for default field values
 def utc_now() -> datetime:
     """Return current UTC timestamp."""
     return datetime.now(timezone.utc)
 
 
+def new_id() -> str:
+    """Return a random UUID4 string without building a UUID object."""
+    raw = bytearray(os.urandom(16))
+    raw[6] = raw[6] & 0x0F | 0x40  # version 4
+    raw[8] = raw[8] & 0x3F | 0x80  # RFC 4122 variant
+    h = raw.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
 # Project Models
 class ProjectCreate(BaseModel):
     """Schema for creating a Project."""
@@ -74,11 +88,14 @@ class ProjectCreate(BaseModel):
 class Project(ProjectCreate):
     """Full Project model with all fields."""
 
-    id: str = Field(default_factory=lambda: str(uuid4()), description="Unique project ID")
+    id: str = Field(default_factory=new_id, description="Unique project ID")
     created_at: datetime = Field(default_factory=utc_now, description="Creation timestamp")
     updated_at: datetime = Field(default_factory=utc_now, description="Last update timestamp")
 
-    model_config = {"json_schema_extra": {"example": {"name": "E-commerce Platform"}}}
+    model_config = {
+        "frozen": True,
+        "json_schema_extra": {"example": {"name": "E-commerce Platform"}},
+    }
 
 
 class ProjectUpdate(BaseModel):
@@ -103,7 +120,7 @@ class PRDCreate(BaseModel):
 class PRD(PRDCreate):
     """Full PRD model with all fields."""
 
-    id: str = Field(default_factory=lambda: str(uuid4()), description="Unique PRD ID")
+    id: str = Field(default_factory=new_id, description="Unique PRD ID")
     status: PRDStatus = Field(default=PRDStatus.DRAFT, description="PRD status")
     created_by: str = Field(..., description="Creator agent ID (alias for agent_id)")
     created_at: datetime = Field(default_factory=utc_now, description="Creation timestamp")
@@ -116,6 +133,7 @@ class PRD(PRDCreate):
         super().__init__(**data)
 
     model_config = {
+        "frozen": True,
         "json_schema_extra": {
             "example": {
                 "project_id": "proj-123",
@@ -161,12 +179,13 @@ class StoryCreate(BaseModel):
 class Story(StoryCreate):
     """Full Story model with all fields."""
 
-    id: str = Field(default_factory=lambda: str(uuid4()), description="Unique story ID")
+    id: str = Field(default_factory=new_id, description="Unique story ID")
     status: StoryStatus = Field(default=StoryStatus.TODO, description="Story status")
     created_at: datetime = Field(default_factory=utc_now, description="Creation timestamp")
     updated_at: datetime = Field(default_factory=utc_now, description="Last update timestamp")
 
     model_config = {
+        "frozen": True,
         "json_schema_extra": {
             "example": {
                 "prd_id": "prd-123",
@@ -200,6 +219,16 @@ class StoryUpdate(BaseModel):
 
 
 # Task Models
+def _unique_task_ids(v: list[str]) -> list[str]:
+    """Validate a list of task IDs has unique values."""
+    if len(v) != len(dict.fromkeys(v)):
+        raise ValueError("depends_on must contain unique task IDs")
+    return v
+
+
+TaskIds = Annotated[list[str], AfterValidator(_unique_task_ids)]
+
+
 class TaskCreate(BaseModel):
     """Schema for creating a Task."""
 
@@ -208,29 +237,22 @@ class TaskCreate(BaseModel):
     title: str = Field(..., min_length=1, description="Task title")
     description: str = Field(..., description="Task description")
     assigned_to: str = Field(..., description="Assigned agent ID (required)")
-    depends_on: list[str] = Field(
+    depends_on: TaskIds = Field(
         default_factory=list, description="List of task IDs this depends on"
     )
     metadata: dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
 
-    @field_validator("depends_on")
-    @classmethod
-    def validate_depends_on(cls, v: list[str]) -> list[str]:
-        """Validate depends_on list has unique values."""
-        if len(v) != len(set(v)):
-            raise ValueError("depends_on must contain unique task IDs")
-        return v
-
 
 class Task(TaskCreate):
     """Full Task model with all fields."""
 
-    id: str = Field(default_factory=lambda: str(uuid4()), description="Unique task ID")
+    id: str = Field(default_factory=new_id, description="Unique task ID")
     status: TaskStatus = Field(default=TaskStatus.TODO, description="Task status")
     created_at: datetime = Field(default_factory=utc_now, description="Creation timestamp")
     updated_at: datetime = Field(default_factory=utc_now, description="Last update timestamp")
 
     model_config = {
+        "frozen": True,
         "json_schema_extra": {
             "example": {
                 "story_id": "story-123",
@@ -250,17 +272,9 @@ class TaskUpdate(BaseModel):
     description: str | None = None
     status: TaskStatus | None = None
     assigned_to: str | None = None
-    depends_on: list[str] | None = None
+    depends_on: TaskIds | None = None
     metadata: dict[str, Any] | None = None
 
-    @field_validator("depends_on")
-    @classmethod
-    def validate_depends_on(cls, v: list[str] | None) -> list[str] | None:
-        """Validate depends_on list has unique values."""
-        if v is not None and len(v) != len(set(v)):
-            raise ValueError("depends_on must contain unique task IDs")
-        return v
-
 
 # Comment Models
 class CommentCreate(BaseModel):
@@ -279,7 +293,7 @@ class CommentCreate(BaseModel):
 class Comment(CommentCreate):
     """Full Comment model with all fields."""
 
-    id: str = Field(default_factory=lambda: str(uuid4()), description="Unique comment ID")
+    id: str = Field(default_factory=new_id, description="Unique comment ID")
     author: str = Field(..., description="Author agent ID (alias for agent_id)")
     created_at: datetime = Field(default_factory=utc_now, description="Creation timestamp")
 
@@ -290,6 +304,7 @@ class Comment(CommentCreate):
         super().__init__(**data)
 
     model_config = {
+        "frozen": True,
         "json_schema_extra": {
             "example": {
                 "entity_type": "task",
@@ -1,5 +1,14 @@
 """High-level store operations for noGojira."""
 
+import sqlite3
+import threading
+from collections.abc import Generator
+from contextlib import contextmanager
+from copy import deepcopy
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel
 
 from .database import Database
 from .events import Event, EventType, get_event_queue
@@ -29,6 +38,26 @@ from .models import (
 )
 
 
+def _fields(create: BaseModel) -> dict[str, Any]:
+    """Copy a create model's field values, so the result shares no containers with it."""
+    fields = dict(create)
+    fields["metadata"] = deepcopy(fields["metadata"])
+    if "depends_on" in fields:
+        fields["depends_on"] = list(fields["depends_on"])
+    return fields
+
+
+@contextmanager
+def _parent_must_exist(message: str) -> Generator[None, None, None]:
+    """Report an insert rejected by a foreign key as a missing parent."""
+    try:
+        yield
+    except sqlite3.IntegrityError as e:
+        if "FOREIGN KEY" not in str(e):
+            raise
+        raise ValueError(message) from e
+
+
 class Store:
     """High-level store for noGojira business logic."""
 
@@ -36,15 +65,46 @@ class Store:
         """Initialize store with database."""
         self.db = db or Database()
         self.events = get_event_queue()
+        # Events held back by this thread's open transaction()
+        self._local = threading.local()
+
+    @contextmanager
+    def transaction(self) -> Generator[None, None, None]:
+        """Run all store operations in the block as one database transaction.
+
+        Events are published only once the transaction commits.
+        """
+        if getattr(self._local, "pending", None) is not None:
+            # Already inside a transaction; join it
+            with self.db.transaction():
+                yield
+            return
+        pending: list[Event] = []
+        self._local.pending = pending
+        try:
+            with self.db.transaction():
+                yield
+        finally:
+            self._local.pending = None
+        self.events.push_many(pending)
+
+    def _emit(self, *events: Event) -> None:
+        """Publish events now, or on commit when a transaction is open."""
+        pending = getattr(self._local, "pending", None)
+        if pending is not None:
+            pending.extend(events)
+        else:
+            self.events.push_many(events)
 
     # Project operations
     def create_project(self, project_create: ProjectCreate, agent_id: str = "system") -> Project:
         """Create a new project."""
-        project = Project(**project_create.model_dump())
+        # Input was validated on ProjectCreate; skip re-validation
+        project = Project.model_construct(**_fields(project_create))
         result = self.db.create_project(project)
         
         # Emit event
-        self.events.push(Event(
+        self._emit(Event(
             event_type=EventType.PROJECT_CREATED,
             agent_id=agent_id,
             entity_type="project",
@@ -69,9 +129,20 @@ class Store:
             task_count=stats["task_count"],
         )
 
-    def list_projects(self, limit: int = 50, offset: int = 0) -> list[Project]:
+    def list_projects(
+        self,
+        limit: int = 50,
+        offset: int = 0,
+        after: tuple[datetime, str] | None = None,
+    ) -> list[Project]:
         """List all projects."""
-        return self.db.list_projects(limit=limit, offset=offset)
+        return self.db.list_projects(limit=limit, offset=offset, after=after)
+
+    def list_projects_with_stats(
+        self, limit: int = 50, offset: int = 0
+    ) -> list[ProjectWithStats]:
+        """List projects together with their PRD, story and task counts."""
+        return self.db.list_projects_with_counts(limit=limit, offset=offset)
 
     def update_project(
         self, project_id: str, project_update: ProjectUpdate
@@ -87,16 +158,12 @@ class Store:
     # PRD operations
     def create_prd(self, prd_create: PRDCreate, agent_id: str = "system") -> PRD:
         """Create a new PRD."""
-        # Verify project exists
-        project = self.db.get_project(prd_create.project_id)
-        if not project:
-            raise ValueError(f"Project {prd_create.project_id} not found")
-
-        prd = PRD(**prd_create.model_dump())
-        result = self.db.create_prd(prd)
+        prd = PRD.model_construct(**_fields(prd_create), created_by=prd_create.agent_id)
+        with _parent_must_exist(f"Project {prd_create.project_id} not found"):
+            result = self.db.create_prd(prd)
         
         # Emit event
-        self.events.push(Event(
+        self._emit(Event(
             event_type=EventType.PRD_CREATED,
             agent_id=agent_id,
             entity_type="prd",
@@ -160,16 +227,12 @@ class Store:
     # Story operations
     def create_story(self, story_create: StoryCreate, agent_id: str = "system") -> Story:
         """Create a new story."""
-        # Verify PRD exists
-        prd = self.db.get_prd(story_create.prd_id)
-        if not prd:
-            raise ValueError(f"PRD {story_create.prd_id} not found")
-
-        story = Story(**story_create.model_dump())
-        result = self.db.create_story(story)
+        story = Story.model_construct(**_fields(story_create))
+        with _parent_must_exist(f"PRD {story_create.prd_id} not found"):
+            result = self.db.create_story(story)
         
         # Emit event
-        self.events.push(Event(
+        self._emit(Event(
             event_type=EventType.STORY_CREATED,
             agent_id=agent_id,
             entity_type="story",
@@ -227,22 +290,23 @@ class Store:
     # Task operations
     def create_task(self, task_create: TaskCreate, agent_id: str = "system") -> Task:
         """Create a new task."""
-        # Verify story exists
-        story = self.db.get_story(task_create.story_id)
-        if not story:
-            raise ValueError(f"Story {task_create.story_id} not found")
+        # Verify dependencies exist before inserting; depends_on has no foreign
+        # key, and a failed check must leave nothing behind in an outer transaction
+        if task_create.depends_on:
+            found = self.db.existing_ids("tasks", set(task_create.depends_on))
+            missing = [dep_id for dep_id in task_create.depends_on if dep_id not in found]
+            if missing:
+                # A missing story is still reported first
+                if not self.db.existing_ids("stories", {task_create.story_id}):
+                    raise ValueError(f"Story {task_create.story_id} not found")
+                raise ValueError(f"Dependency task {missing[0]} not found")
+
+        task = Task.model_construct(**_fields(task_create))
+        with _parent_must_exist(f"Story {task_create.story_id} not found"):
+            result = self.db.create_task(task)
 
-        # Verify dependencies exist
-        for dep_id in task_create.depends_on:
-            dep_task = self.db.get_task(dep_id)
-            if not dep_task:
-                raise ValueError(f"Dependency task {dep_id} not found")
-
-        task = Task(**task_create.model_dump())
-        result = self.db.create_task(task)
-        
         # Emit event
-        self.events.push(Event(
+        self._emit(Event(
             event_type=EventType.TASK_CREATED,
             agent_id=agent_id,
             entity_type="task",
@@ -250,9 +314,43 @@ class Store:
             entity_name=result.title,
             details={"story_id": result.story_id, "assigned_to": result.assigned_to},
         ))
-        
+
         return result
 
+    def create_tasks(
+        self, task_creates: list[TaskCreate], agent_id: str = "system"
+    ) -> list[Task]:
+        """Create several tasks, checking parents and dependencies once per batch."""
+        with self.transaction():
+            stories = self.db.existing_ids("stories", {tc.story_id for tc in task_creates})
+            dependencies = self.db.existing_ids(
+                "tasks", {dep_id for tc in task_creates for dep_id in tc.depends_on}
+            )
+            for task_create in task_creates:
+                if task_create.story_id not in stories:
+                    raise ValueError(f"Story {task_create.story_id} not found")
+                for dep_id in task_create.depends_on:
+                    if dep_id not in dependencies:
+                        raise ValueError(f"Dependency task {dep_id} not found")
+
+            results = self.db.create_tasks_bulk(
+                [Task.model_construct(**_fields(task_create)) for task_create in task_creates]
+            )
+
+            self._emit(*(
+                Event(
+                    event_type=EventType.TASK_CREATED,
+                    agent_id=agent_id,
+                    entity_type="task",
+                    entity_id=result.id,
+                    entity_name=result.title,
+                    details={"story_id": result.story_id, "assigned_to": result.assigned_to},
+                )
+                for result in results
+            ))
+
+        return results
+
     def get_task(self, task_id: str) -> Task | None:
         """Get a task by ID."""
         return self.db.get_task(task_id)
@@ -288,6 +386,12 @@ class Store:
             return self.db.get_task(task_id)
         return self.db.update_task(task_id, updates)
 
+    def update_task_statuses(self, updates: list[tuple[str, TaskStatus | str]]) -> list[str]:
+        """Set the status of several tasks at once; return the IDs that were updated."""
+        return self.db.update_task_statuses(
+            [(task_id, TaskStatus(status)) for task_id, status in updates]
+        )
+
     def get_agent_workload(
         self,
         agent_id: str,
@@ -344,7 +448,9 @@ class Store:
         if not entity:
             raise ValueError(f"{entity_type.value} {entity_id} not found")
 
-        comment = Comment(**comment_create.model_dump())
+        comment = Comment.model_construct(
+            **_fields(comment_create), author=comment_create.agent_id
+        )
         return self.db.create_comment(comment)
 
     def get_comments(
@@ -376,7 +482,8 @@ class Store:
             (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0.0
         )
 
-        return StoryProgress(
+        # Counts are computed here; skip re-validation
+        return StoryProgress.model_construct(
             story=story,
             total_tasks=total_tasks,
             completed_tasks=completed_tasks,
@@ -391,43 +498,15 @@ class Store:
         if not project:
             return None
 
-        # Get all PRDs
-        prds = self.db.list_prds(project_id=project_id, limit=1000)
-        total_prds = len(prds)
-
-        # Get all stories across all PRDs
-        all_stories = []
-        for prd in prds:
-            stories = self.db.list_stories(prd_id=prd.id, limit=1000)
-            all_stories.extend(stories)
-
-        total_stories = len(all_stories)
-
-        # Count stories by status
-        stories_by_status: dict[str, int] = {}
-        for story in all_stories:
-            status = story.status.value
-            stories_by_status[status] = stories_by_status.get(status, 0) + 1
-
-        # Get all tasks across all stories
-        all_tasks = []
-        for story in all_stories:
-            tasks = self.db.list_tasks(story_id=story.id, limit=1000)
-            all_tasks.extend(tasks)
-
-        total_tasks = len(all_tasks)
-
-        # Count tasks by status
-        tasks_by_status: dict[str, int] = {}
-        for task in all_tasks:
-            status = task.status.value
-            tasks_by_status[status] = tasks_by_status.get(status, 0) + 1
-
-        # Count tasks by agent
-        tasks_by_agent: dict[str, int] = {}
-        for task in all_tasks:
-            agent = task.assigned_to
-            tasks_by_agent[agent] = tasks_by_agent.get(agent, 0) + 1
+        # Counts are aggregated in SQL rather than by listing every entity
+        stats = self.db.get_project_stats(project_id)
+        breakdown = self.db.get_project_breakdown(project_id)
+        total_prds = stats["prd_count"]
+        total_stories = stats["story_count"]
+        total_tasks = stats["task_count"]
+        stories_by_status = breakdown["stories_by_status"]
+        tasks_by_status = breakdown["tasks_by_status"]
+        tasks_by_agent = breakdown["tasks_by_agent"]
 
         # Calculate completion percentage
         completed_tasks = tasks_by_status.get("done", 0)
@@ -435,7 +514,7 @@ class Store:
             (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0.0
         )
 
-        return ProjectProgress(
+        return ProjectProgress.model_construct(
             project_id=project_id,
             total_prds=total_prds,
             total_stories=total_stories,
@@ -3,6 +3,7 @@
 import reflex as rx
 
 from .events import get_event_queue
+from .models import Project, ProjectWithStats
 from .store import Store
 
 # Initialize
@@ -34,38 +35,28 @@ class State(rx.State):
 
     def refresh_all(self):
         """Refresh all dashboard data."""
-        self.refresh_stats()
-        self.refresh_projects()
+        projects = store.list_projects_with_stats(limit=1000)
+        self._apply_stats(projects)
+        self._apply_projects(projects[:100])
         self.refresh_activity()
 
     def refresh_stats(self):
         """Refresh dashboard statistics."""
-        projects = store.list_projects(limit=1000)
-        self.total_projects = len(projects)
-
-        prd_count = 0
-        story_count = 0
-        task_count = 0
-
-        for project in projects:
-            prds = store.list_prds(project_id=project.id, limit=1000)
-            prd_count += len(prds)
-
-            for prd in prds:
-                stories = store.list_stories(prd_id=prd.id, limit=1000)
-                story_count += len(stories)
-
-                for story in stories:
-                    tasks = store.list_tasks(story_id=story.id, limit=1000)
-                    task_count += len(tasks)
-
-        self.total_prds = prd_count
-        self.total_stories = story_count
-        self.total_tasks = task_count
+        self._apply_stats(store.list_projects_with_stats(limit=1000))
 
     def refresh_projects(self):
         """Refresh projects list."""
-        projects = store.list_projects(limit=100)
+        self._apply_projects(store.list_projects(limit=100))
+
+    def _apply_stats(self, projects: list[ProjectWithStats]):
+        """Aggregate dashboard totals from per-project counts."""
+        self.total_projects = len(projects)
+        self.total_prds = sum(p.prd_count for p in projects)
+        self.total_stories = sum(p.story_count for p in projects)
+        self.total_tasks = sum(p.task_count for p in projects)
+
+    def _apply_projects(self, projects: list[Project]):
+        """Populate the projects list from loaded projects."""
         self.projects = [
             {
                 "id": p.id,
@@ -0,0 +1,26 @@
+"""Shared fixtures for noGojira tests."""
+
+from collections.abc import Callable
+
+import pytest
+
+from src.database import Database
+from src.models import Project
+
+
+@pytest.fixture(scope="session")
+def shared_db():
+    """Create one in-memory database (and schema) for the whole test session."""
+    db = Database(":memory:", fast=True)
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def make_project() -> Callable[..., Project]:
+    """Return a factory for trusted test projects that skips validation."""
+
+    def factory(name: str, **fields) -> Project:
+        return Project.model_construct(name=name, **fields)
+
+    return factory
@@ -1,7 +1,9 @@
 """Tests for database layer."""
 
+import math
 import sqlite3
-import tempfile
+import threading
+from datetime import datetime, timezone
 from pathlib import Path
 
 import pytest
@@ -22,12 +24,193 @@ from src.models import (
 
 
 @pytest.fixture
-def temp_db():
-    """Create a temporary database for testing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        db_path = Path(tmpdir) / "test.db"
-        db = Database(db_path)
-        yield db
+def temp_db(shared_db):
+    """Provide the shared in-memory database, emptied after each test."""
+    yield shared_db
+    shared_db.clear()
+
+
+@pytest.fixture
+def scaffold(temp_db):
+    """Create a project -> PRD -> story chain to attach rows to."""
+    project = Project(name="Test")
+    prd = PRD(
+        project_id=project.id,
+        agent_id="agent",
+        title="Test",
+        description="Test",
+    )
+    story = Story(
+        prd_id=prd.id,
+        agent_id="agent",
+        title="Test",
+        description="Test",
+    )
+    with temp_db.transaction():
+        temp_db.create_project(project)
+        temp_db.create_prd(prd)
+        temp_db.create_story(story)
+    return project, prd, story
+
+
+@pytest.fixture
+def disk_db(tmp_path_factory):
+    """Create a temporary file-backed database for testing."""
+    db_path = tmp_path_factory.mktemp("db") / "test.db"
+    db = Database(db_path, fast=True)
+    yield db
+    db.close()
+
+
+class TestDatabaseBackends:
+    """Tests for in-memory and file-backed databases."""
+
+    def test_memory_databases_are_isolated(self):
+        """Test that each in-memory database has its own data."""
+        db1 = Database(":memory:")
+        db2 = Database(":memory:")
+        try:
+            project = Project(name="Only in db1")
+            db1.create_project(project)
+
+            assert db1.get_project(project.id) is not None
+            assert db2.get_project(project.id) is None
+        finally:
+            db1.close()
+            db2.close()
+
+    def test_memory_path_object_shares_one_database(self):
+        """Test that Path(":memory:") is one database across pooled connections."""
+        db = Database(Path(":memory:"))
+        try:
+            project = Project(name="Shared")
+            db.create_project(project)
+
+            found = []
+            thread = threading.Thread(target=lambda: found.append(db.get_project(project.id)))
+            thread.start()
+            thread.join()
+
+            assert found[0] is not None
+        finally:
+            db.close()
+
+    def test_clear_removes_all_rows(self, temp_db):
+        """Test that clearing the database keeps the schema usable."""
+        project = Project(name="Test")
+        temp_db.create_project(project)
+        temp_db.create_prd(
+            PRD(
+                project_id=project.id,
+                agent_id="agent",
+                title="Test",
+                description="Test",
+            )
+        )
+
+        temp_db.clear()
+
+        assert temp_db.list_projects() == []
+        assert temp_db.list_prds() == []
+        temp_db.create_project(Project(name="After clear"))
+        assert len(temp_db.list_projects()) == 1
+
+    def test_fast_disk_database_uses_wal(self, disk_db):
+        """Test that a fast file-backed database is switched to WAL mode."""
+        conn = sqlite3.connect(disk_db.db_path)
+        journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        conn.close()
+        assert journal_mode == "wal"
+
+    def test_transaction_rolls_back_on_error(self, temp_db):
+        """Test that a failing transaction discards all of its writes."""
+        with pytest.raises(sqlite3.IntegrityError):
+            with temp_db.transaction():
+                temp_db.create_project(Project(name="Rolled back"))
+                temp_db.create_prd(
+                    PRD(
+                        project_id="nonexistent",
+                        agent_id="agent",
+                        title="Test",
+                        description="Test",
+                    )
+                )
+
+        assert temp_db.list_projects() == []
+
+    def test_disk_database_persists(self, disk_db):
+        """Test that a file-backed database survives reopening."""
+        project = Project(name="Persisted")
+        disk_db.create_project(project)
+
+        reopened = Database(disk_db.db_path)
+        try:
+            assert reopened.get_project(project.id).name == "Persisted"
+        finally:
+            reopened.close()
+
+    def test_connection_reused_within_thread(self):
+        """Test that operations on one thread share a pooled connection."""
+        db = Database(":memory:")
+        try:
+            with db._get_connection() as first, db._get_connection() as second:
+                assert first is second
+        finally:
+            db.close()
+        with pytest.raises(sqlite3.ProgrammingError):
+            first.execute("SELECT 1")
+
+    def test_connections_closed_when_threads_exit(self, disk_db):
+        """Test that short-lived threads do not leave connections open."""
+        opened = []
+
+        def work():
+            with disk_db._get_connection() as conn:
+                opened.append(conn)
+            disk_db.list_projects()
+
+        for _ in range(20):
+            thread = threading.Thread(target=work)
+            thread.start()
+            thread.join()
+
+        assert len(opened) == 20
+        assert disk_db._pool._connections == {disk_db._pool.acquire()}
+        for conn in opened:
+            with pytest.raises(sqlite3.ProgrammingError):
+                conn.execute("SELECT 1")
+
+
+class TestJsonColumns:
+    """Tests for values stored in JSON columns."""
+
+    def test_metadata_round_trips_beyond_orjson(self, temp_db):
+        """Test that values orjson cannot represent are stored like json would."""
+        project = Project(
+            name="Test",
+            metadata={
+                "big": 2**70,
+                "negative": -(2**63) - 1,
+                "inf": float("inf"),
+                "nan": float("nan"),
+                "none": None,
+            },
+        )
+        temp_db.create_project(project)
+
+        metadata = temp_db.get_project(project.id).metadata
+        assert metadata["big"] == 2**70
+        assert metadata["negative"] == -(2**63) - 1
+        assert isinstance(metadata["negative"], int)
+        assert metadata["inf"] == float("inf")
+        assert math.isnan(metadata["nan"])
+        assert metadata["none"] is None
+
+    def test_metadata_rejects_non_json_values(self, temp_db):
+        """Test that datetimes are rejected whether or not orjson is installed."""
+        project = Project(name="Test", metadata={"when": datetime.now(timezone.utc)})
+        with pytest.raises(TypeError):
+            temp_db.create_project(project)
 
 
 class TestProjectOperations:
@@ -52,9 +235,9 @@ class TestProjectOperations:
         result = temp_db.get_project("nonexistent-id")
         assert result is None
 
-    def test_list_projects(self, temp_db):
+    def test_list_projects(self, temp_db, make_project):
         """Test listing projects."""
-        projects = [Project(name=f"Project {i}") for i in range(5)]
+        projects = [make_project(f"Project {i}") for i in range(5)]
         for project in projects:
             temp_db.create_project(project)
 
@@ -63,10 +246,9 @@ class TestProjectOperations:
         # Should be ordered by created_at DESC
         assert listed[0].name == "Project 4"
 
-    def test_list_projects_pagination(self, temp_db):
+    def test_list_projects_pagination(self, temp_db, make_project):
         """Test project listing with pagination."""
-        for i in range(10):
-            temp_db.create_project(Project(name=f"Project {i}"))
+        temp_db.create_projects_bulk([make_project(f"Project {i}") for i in range(10)])
 
         # First page
         page1 = temp_db.list_projects(limit=5, offset=0)
@@ -81,6 +263,12 @@ class TestProjectOperations:
         page2_ids = {p.id for p in page2}
         assert len(page1_ids.intersection(page2_ids)) == 0
 
+        # Keyset page continues exactly where the first page ended
+        last = page1[-1]
+        keyset_page2 = temp_db.list_projects(limit=5, after=(last.created_at, last.id))
+        assert [p.id for p in keyset_page2] == [p.id for p in page2]
+        assert temp_db.list_projects(after=(page2[-1].created_at, page2[-1].id)) == []
+
     def test_update_project(self, temp_db):
         """Test updating a project."""
         project = Project(name="Original", description="Original description")
@@ -95,6 +283,10 @@ class TestProjectOperations:
         assert updated.name == "Updated"
         assert updated.description == "Updated description"
 
+    def test_update_nonexistent_project(self, temp_db):
+        """Test updating a project that doesn't exist."""
+        assert temp_db.update_project("nonexistent-id", {"name": "Updated"}) is None
+
     def test_update_project_partial(self, temp_db):
         """Test partial project update."""
         project = Project(name="Original", description="Keep this")
@@ -147,15 +339,17 @@ class TestPRDOperations:
         temp_db.create_project(project1)
         temp_db.create_project(project2)
 
-        for i in range(3):
-            temp_db.create_prd(
+        temp_db.create_prds_bulk(
+            [
                 PRD(
                     project_id=project1.id,
                     agent_id="agent",
                     title=f"PRD {i}",
                     description="Test",
                 )
-            )
+                for i in range(3)
+            ]
+        )
         temp_db.create_prd(
             PRD(
                 project_id=project2.id,
@@ -171,42 +365,9 @@ class TestPRDOperations:
         project2_prds = temp_db.list_prds(project_id=project2.id)
         assert len(project2_prds) == 1
 
-    def test_list_prds_by_status(self, temp_db):
-        """Test listing PRDs filtered by status."""
-        project = Project(name="Test")
-        temp_db.create_project(project)
-
-        temp_db.create_prd(
-            PRD(
-                project_id=project.id,
-                agent_id="agent",
-                title="Draft",
-                description="Test",
-                status=PRDStatus.DRAFT,
-            )
-        )
-        temp_db.create_prd(
-            PRD(
-                project_id=project.id,
-                agent_id="agent",
-                title="Active",
-                description="Test",
-                status=PRDStatus.ACTIVE,
-            )
-        )
-
-        draft_prds = temp_db.list_prds(status="draft")
-        assert len(draft_prds) == 1
-        assert draft_prds[0].title == "Draft"
-
-        active_prds = temp_db.list_prds(status="active")
-        assert len(active_prds) == 1
-        assert active_prds[0].title == "Active"
-
-    def test_update_prd(self, temp_db):
+    def test_update_prd(self, temp_db, scaffold):
         """Test updating a PRD."""
-        project = Project(name="Test")
-        temp_db.create_project(project)
+        project, _, _ = scaffold
 
         prd = PRD(
             project_id=project.id,
@@ -229,18 +390,9 @@ class TestPRDOperations:
 class TestStoryOperations:
     """Tests for Story database operations."""
 
-    def test_create_and_get_story(self, temp_db):
+    def test_create_and_get_story(self, temp_db, scaffold):
         """Test creating and retrieving a story."""
-        project = Project(name="Test")
-        temp_db.create_project(project)
-
-        prd = PRD(
-            project_id=project.id,
-            agent_id="agent",
-            title="Test PRD",
-            description="Test",
-        )
-        temp_db.create_prd(prd)
+        _, prd, _ = scaffold
 
         story = Story(
             prd_id=prd.id,
@@ -294,54 +446,9 @@ class TestStoryOperations:
         prd1_stories = temp_db.list_stories(prd_id=prd1.id)
         assert len(prd1_stories) == 3
 
-    def test_list_stories_by_assigned_agent(self, temp_db):
-        """Test listing stories filtered by assigned agent."""
-        project = Project(name="Test")
-        temp_db.create_project(project)
-
-        prd = PRD(
-            project_id=project.id,
-            agent_id="agent",
-            title="Test",
-            description="Test",
-        )
-        temp_db.create_prd(prd)
-
-        temp_db.create_story(
-            Story(
-                prd_id=prd.id,
-                agent_id="agent",
-                title="Story 1",
-                description="Test",
-                assigned_to="agent-1",
-            )
-        )
-        temp_db.create_story(
-            Story(
-                prd_id=prd.id,
-                agent_id="agent",
-                title="Story 2",
-                description="Test",
-                assigned_to="agent-2",
-            )
-        )
-
-        agent1_stories = temp_db.list_stories(assigned_to="agent-1")
-        assert len(agent1_stories) == 1
-        assert agent1_stories[0].title == "Story 1"
-
-    def test_update_story(self, temp_db):
+    def test_update_story(self, temp_db, scaffold):
         """Test updating a story."""
-        project = Project(name="Test")
-        temp_db.create_project(project)
-
-        prd = PRD(
-            project_id=project.id,
-            agent_id="agent",
-            title="Test",
-            description="Test",
-        )
-        temp_db.create_prd(prd)
+        _, prd, _ = scaffold
 
         story = Story(
             prd_id=prd.id,
@@ -369,26 +476,9 @@ class TestStoryOperations:
 class TestTaskOperations:
     """Tests for Task database operations."""
 
-    def test_create_and_get_task(self, temp_db):
+    def test_create_and_get_task(self, temp_db, scaffold):
         """Test creating and retrieving a task."""
-        project = Project(name="Test")
-        temp_db.create_project(project)
-
-        prd = PRD(
-            project_id=project.id,
-            agent_id="agent",
-            title="Test",
-            description="Test",
-        )
-        temp_db.create_prd(prd)
-
-        story = Story(
-            prd_id=prd.id,
-            agent_id="agent",
-            title="Test Story",
-            description="Test",
-        )
-        temp_db.create_story(story)
+        _, _, story = scaffold
 
         task = Task(
             story_id=story.id,
@@ -406,26 +496,9 @@ class TestTaskOperations:
         assert retrieved.title == "Test Task"
         assert retrieved.assigned_to == "backend-agent"
 
-    def test_task_with_dependencies(self, temp_db):
+    def test_task_with_dependencies(self, temp_db, scaffold):
         """Test creating and retrieving a task with dependencies."""
-        project = Project(name="Test")
-        temp_db.create_project(project)
-
-        prd = PRD(
-            project_id=project.id,
-            agent_id="agent",
-            title="Test",
-            description="Test",
-        )
-        temp_db.create_prd(prd)
-
-        story = Story(
-            prd_id=prd.id,
-            agent_id="agent",
-            title="Test",
-            description="Test",
-        )
-        temp_db.create_story(story)
+        _, _, story = scaffold
 
         task1 = Task(
             story_id=story.id,
@@ -449,6 +522,33 @@ class TestTaskOperations:
         retrieved = temp_db.get_task(task2.id)
         assert retrieved.depends_on == [task1.id]
 
+    def test_task_dependencies_with_non_uuid_ids(self, temp_db, scaffold):
+        """Test that dependency IDs which are not UUIDs round-trip unchanged."""
+        _, _, story = scaffold
+
+        for task_id in ("task-a", "task-b"):
+            temp_db.create_task(
+                Task(
+                    id=task_id,
+                    story_id=story.id,
+                    agent_id="agent",
+                    title=task_id,
+                    description="Test",
+                    assigned_to="agent",
+                )
+            )
+        task = Task(
+            story_id=story.id,
+            agent_id="agent",
+            title="Dependent",
+            description="Test",
+            assigned_to="agent",
+            depends_on=["task-a", "task-b"],
+        )
+        temp_db.create_task(task)
+
+        assert temp_db.get_task(task.id).depends_on == ["task-a", "task-b"]
+
     def test_list_tasks_by_story(self, temp_db):
         """Test listing tasks filtered by story."""
         project = Project(name="Test")
@@ -500,116 +600,9 @@ class TestTaskOperations:
         story1_tasks = temp_db.list_tasks(story_id=story1.id)
         assert len(story1_tasks) == 3
 
-    def test_list_tasks_by_assigned_agent(self, temp_db):
-        """Test listing tasks filtered by assigned agent."""
-        project = Project(name="Test")
-        temp_db.create_project(project)
-
-        prd = PRD(
-            project_id=project.id,
-            agent_id="agent",
-            title="Test",
-            description="Test",
-        )
-        temp_db.create_prd(prd)
-
-        story = Story(
-            prd_id=prd.id,
-            agent_id="agent",
-            title="Test",
-            description="Test",
-        )
-        temp_db.create_story(story)
-
-        temp_db.create_task(
-            Task(
-                story_id=story.id,
-                agent_id="agent",
-                title="Task 1",
-                description="Test",
-                assigned_to="agent-1",
-            )
-        )
-        temp_db.create_task(
-            Task(
-                story_id=story.id,
-                agent_id="agent",
-                title="Task 2",
-                description="Test",
-                assigned_to="agent-2",
-            )
-        )
-
-        agent1_tasks = temp_db.list_tasks(assigned_to="agent-1")
-        assert len(agent1_tasks) == 1
-        assert agent1_tasks[0].title == "Task 1"
-
-    def test_list_tasks_by_status(self, temp_db):
-        """Test listing tasks filtered by status."""
-        project = Project(name="Test")
-        temp_db.create_project(project)
-
-        prd = PRD(
-            project_id=project.id,
-            agent_id="agent",
-            title="Test",
-            description="Test",
-        )
-        temp_db.create_prd(prd)
-
-        story = Story(
-            prd_id=prd.id,
-            agent_id="agent",
-            title="Test",
-            description="Test",
-        )
-        temp_db.create_story(story)
-
-        temp_db.create_task(
-            Task(
-                story_id=story.id,
-                agent_id="agent",
-                title="Todo Task",
-                description="Test",
-                assigned_to="agent",
-                status=TaskStatus.TODO,
-            )
-        )
-        temp_db.create_task(
-            Task(
-                story_id=story.id,
-                agent_id="agent",
-                title="Done Task",
-                description="Test",
-                assigned_to="agent",
-                status=TaskStatus.DONE,
-            )
-        )
-
-        todo_tasks = temp_db.list_tasks(status="todo")
-        assert len(todo_tasks) == 1
-        assert todo_tasks[0].title == "Todo Task"
-
-    def test_update_task(self, temp_db):
+    def test_update_task(self, temp_db, scaffold):
         """Test updating a task."""
-        project = Project(name="Test")
-        temp_db.create_project(project)
-
-        prd = PRD(
-            project_id=project.id,
-            agent_id="agent",
-            title="Test",
-            description="Test",
-        )
-        temp_db.create_prd(prd)
-
-        story = Story(
-            prd_id=prd.id,
-            agent_id="agent",
-            title="Test",
-            description="Test",
-        )
-        temp_db.create_story(story)
+        _, _, story = scaffold
 
         task = Task(
             story_id=story.id,
@@ -635,29 +628,69 @@ class TestTaskOperations:
         assert updated.assigned_to == "new-agent"
 
 
+@pytest.fixture
+def filter_rows(temp_db, scaffold):
+    """Create a "Wanted" and an "Other" PRD, story and task with differing filter values."""
+    project, prd, story = scaffold
+    rows = {"Wanted": ("active", "todo", "agent-1"), "Other": ("archived", "done", "agent-2")}
+    with temp_db.transaction():
+        for title, (prd_status, task_status, agent) in rows.items():
+            temp_db.create_prd(
+                PRD(
+                    project_id=project.id,
+                    agent_id="agent",
+                    title=title,
+                    description="Test",
+                    status=prd_status,
+                )
+            )
+            temp_db.create_story(
+                Story(
+                    prd_id=prd.id,
+                    agent_id="agent",
+                    title=title,
+                    description="Test",
+                    assigned_to=agent,
+                )
+            )
+            temp_db.create_task(
+                Task(
+                    story_id=story.id,
+                    agent_id="agent",
+                    title=title,
+                    description="Test",
+                    status=task_status,
+                    assigned_to=agent,
+                )
+            )
+
+
+class TestListFilters:
+    """Tests for status and assignee filters on list queries."""
+
+    @pytest.mark.parametrize(
+        ("list_method", "column", "wanted", "other"),
+        [
+            ("list_prds", "status", "active", "archived"),
+            ("list_stories", "assigned_to", "agent-1", "agent-2"),
+            ("list_tasks", "status", "todo", "done"),
+            ("list_tasks", "assigned_to", "agent-1", "agent-2"),
+        ],
+    )
+    def test_list_filtered(self, temp_db, filter_rows, list_method, column, wanted, other):
+        """Test that list filters return only matching rows."""
+        list_rows = getattr(temp_db, list_method)
+
+        assert [r.title for r in list_rows(**{column: wanted})] == ["Wanted"]
+        assert [r.title for r in list_rows(**{column: other})] == ["Other"]
+
+
 class TestCommentOperations:
     """Tests for Comment database operations."""
 
-    def test_create_and_get_comments(self, temp_db):
+    def test_create_and_get_comments(self, temp_db, scaffold):
         """Test creating and retrieving comments."""
-        project = Project(name="Test")
-        temp_db.create_project(project)
-
-        prd = PRD(
-            project_id=project.id,
-            agent_id="agent",
-            title="Test",
-            description="Test",
-        )
-        temp_db.create_prd(prd)
-
-        story = Story(
-            prd_id=prd.id,
-            agent_id="agent",
-            title="Test",
-            description="Test",
-        )
-        temp_db.create_story(story)
+        _, _, story = scaffold
 
         task = Task(
             story_id=story.id,
@@ -682,58 +715,46 @@ class TestCommentOperations:
         assert len(comments) == 1
         assert comments[0].content == "This is a comment"
 
-    def test_multiple_comments_on_entity(self, temp_db):
+    def test_multiple_comments_on_entity(self, temp_db, scaffold):
         """Test multiple comments on the same entity."""
-        project = Project(name="Test")
-        temp_db.create_project(project)
-
-        prd = PRD(
-            project_id=project.id,
-            agent_id="agent",
-            title="Test",
-            description="Test",
+        _, prd, _ = scaffold
+
+        temp_db.create_comments_bulk(
+            [
+                Comment(
+                    entity_type=EntityType.PRD,
+                    entity_id=prd.id,
+                    agent_id=f"agent-{i}",
+                    content=f"Comment {i}",
+                )
+                for i in range(5)
+            ]
         )
-        temp_db.create_prd(prd)
-
-        for i in range(5):
-            comment = Comment(
-                entity_type=EntityType.PRD,
-                entity_id=prd.id,
-                agent_id=f"agent-{i}",
-                content=f"Comment {i}",
-            )
-            temp_db.create_comment(comment)
 
         comments = temp_db.get_comments(EntityType.PRD, prd.id)
         assert len(comments) == 5
 
-    def test_comment_types(self, temp_db):
+    def test_comment_types(self, temp_db, scaffold):
         """Test different comment types."""
-        project = Project(name="Test")
-        temp_db.create_project(project)
+        _, prd, _ = scaffold
 
-        prd = PRD(
-            project_id=project.id,
-            agent_id="agent",
-            title="Test",
-            description="Test",
+        temp_db.create_comments_bulk(
+            [
+                Comment(
+                    entity_type=EntityType.PRD,
+                    entity_id=prd.id,
+                    agent_id="agent",
+                    content="Test",
+                    comment_type=comment_type,
+                )
+                for comment_type in [
+                    CommentType.COMMENT,
+                    CommentType.QUESTION,
+                    CommentType.DECISION,
+                    CommentType.BLOCKER,
+                ]
+            ]
         )
-        temp_db.create_prd(prd)
-
-        for comment_type in [
-            CommentType.COMMENT,
-            CommentType.QUESTION,
-            CommentType.DECISION,
-            CommentType.BLOCKER,
-        ]:
-            comment = Comment(
-                entity_type=EntityType.PRD,
-                entity_id=prd.id,
-                agent_id="agent",
-                content="Test",
-                comment_type=comment_type,
-            )
-            temp_db.create_comment(comment)
 
         comments = temp_db.get_comments(EntityType.PRD, prd.id)
         comment_types = {c.comment_type for c in comments}
@@ -745,49 +766,109 @@ class TestStatistics:
 
     def test_get_project_stats(self, temp_db):
         """Test getting project statistics."""
-        project = Project(name="Test")
-        temp_db.create_project(project)
+        with temp_db.transaction():
+            project = Project(name="Test")
+            temp_db.create_project(project)
 
-        # Create 2 PRDs
-        for i in range(2):
-            prd = PRD(
-                project_id=project.id,
-                agent_id="agent",
-                title=f"PRD {i}",
-                description="Test",
+            # Create 2 PRDs
+            prds = temp_db.create_prds_bulk(
+                [
+                    PRD(
+                        project_id=project.id,
+                        agent_id="agent",
+                        title=f"PRD {i}",
+                        description="Test",
+                    )
+                    for i in range(2)
+                ]
             )
-            temp_db.create_prd(prd)
 
             # Create 3 stories per PRD
-            for j in range(3):
-                story = Story(
-                    prd_id=prd.id,
-                    agent_id="agent",
-                    title=f"Story {j}",
-                    description="Test",
-                )
-                temp_db.create_story(story)
+            stories = temp_db.create_stories_bulk(
+                [
+                    Story(
+                        prd_id=prd.id,
+                        agent_id="agent",
+                        title=f"Story {j}",
+                        description="Test",
+                    )
+                    for prd in prds
+                    for j in range(3)
+                ]
+            )
 
-                # Create 2 tasks per story
-                for k in range(2):
-                    task = Task(
+            # Create 2 tasks per story
+            temp_db.create_tasks_bulk(
+                [
+                    Task(
                         story_id=story.id,
                         agent_id="agent",
                         title=f"Task {k}",
                         description="Test",
                         assigned_to="agent",
                     )
-                    temp_db.create_task(task)
+                    for story in stories
+                    for k in range(2)
+                ]
+            )
 
         stats = temp_db.get_project_stats(project.id)
         assert stats["prd_count"] == 2
         assert stats["story_count"] == 6
         assert stats["task_count"] == 12
 
-    def test_get_story_task_counts(self, temp_db):
+    def test_get_project_breakdown(self, temp_db, scaffold):
+        """Test grouping a project's story and task counts."""
+        project, _, story = scaffold
+
+        temp_db.create_tasks_bulk(
+            [
+                Task(
+                    story_id=story.id,
+                    agent_id="agent",
+                    title=f"Task {i}",
+                    description="Test",
+                    assigned_to="agent1" if i < 2 else "agent2",
+                    status=TaskStatus.DONE if i % 2 else TaskStatus.TODO,
+                )
+                for i in range(5)
+            ]
+        )
+
+        breakdown = temp_db.get_project_breakdown(project.id)
+        assert breakdown["stories_by_status"] == {"todo": 1}
+        assert breakdown["tasks_by_status"] == {"todo": 3, "done": 2}
+        assert breakdown["tasks_by_agent"] == {"agent1": 2, "agent2": 3}
+
+    def test_get_story_task_counts(self, temp_db, scaffold):
         """Test getting task counts for a story."""
+        _, _, story = scaffold
+
+        # Create 10 tasks, 3 done
+        temp_db.create_tasks_bulk(
+            [
+                Task(
+                    story_id=story.id,
+                    agent_id="agent",
+                    title=f"Task {i}",
+                    description="Test",
+                    assigned_to="agent",
+                    status=TaskStatus.DONE if i < 3 else TaskStatus.TODO,
+                )
+                for i in range(10)
+            ]
+        )
+
+        total, completed = temp_db.get_story_task_counts(story.id)
+        assert total == 10
+        assert completed == 3
+
+    def test_list_projects_with_counts(self, temp_db):
+        """Test listing projects with aggregated counts."""
         project = Project(name="Test")
+        empty = Project(name="Empty")
         temp_db.create_project(project)
+        temp_db.create_project(empty)
 
         prd = PRD(
             project_id=project.id,
@@ -797,30 +878,33 @@ class TestStatistics:
         )
         temp_db.create_prd(prd)
 
-        story = Story(
-            prd_id=prd.id,
-            agent_id="agent",
-            title="Test",
-            description="Test",
-        )
-        temp_db.create_story(story)
-
-        # Create 10 tasks, 3 done
-        for i in range(10):
-            status = TaskStatus.DONE if i < 3 else TaskStatus.TODO
-            task = Task(
-                story_id=story.id,
+        for i in range(2):
+            story = Story(
+                prd_id=prd.id,
                 agent_id="agent",
-                title=f"Task {i}",
+                title=f"Story {i}",
                 description="Test",
-                assigned_to="agent",
-                status=status,
             )
-            temp_db.create_task(task)
+            temp_db.create_story(story)
 
-        total, completed = temp_db.get_story_task_counts(story.id)
-        assert total == 10
-        assert completed == 3
+            for k in range(3):
+                temp_db.create_task(
+                    Task(
+                        story_id=story.id,
+                        agent_id="agent",
+                        title=f"Task {k}",
+                        description="Test",
+                        assigned_to="agent",
+                    )
+                )
+
+        listed = {p.name: p for p in temp_db.list_projects_with_counts()}
+        assert len(listed) == 2
+        assert listed["Test"].prd_count == 1
+        assert listed["Test"].story_count == 2
+        assert listed["Test"].task_count == 6
+        assert listed["Empty"].prd_count == 0
+        assert listed["Empty"].task_count == 0
 
 
 class TestForeignKeyConstraints:
@@ -837,6 +921,25 @@ class TestForeignKeyConstraints:
             description="Test",
         )
 
+        with temp_db._get_connection() as conn:
+            assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+
         with pytest.raises(sqlite3.IntegrityError):
             temp_db.create_prd(prd)
 
+    def test_foreign_key_enforcement_bulk(self, temp_db):
+        """Test that foreign keys are enforced on bulk inserts too."""
+        prds = [
+            PRD(
+                project_id="nonexistent",
+                agent_id="agent",
+                title=f"PRD {i}",
+                description="Test",
+            )
+            for i in range(3)
+        ]
+
+        with pytest.raises(sqlite3.IntegrityError):
+            temp_db.create_prds_bulk(prds)
+
+        assert temp_db.list_prds() == []
@@ -1,5 +1,6 @@
 """Tests for the event system."""
 
+import json
 from datetime import datetime, timezone
 
 import pytest
@@ -27,6 +28,32 @@ class TestEventModel:
         assert event.entity_name == "Test Project"
         assert isinstance(event.timestamp, datetime)
 
+    def test_timestamp_from_nanoseconds(self):
+        """Test that the stored nanosecond timestamp converts to UTC."""
+        event = Event(
+            event_type=EventType.PROJECT_CREATED,
+            agent_id="agent1",
+            entity_type="project",
+            entity_id="proj_123",
+            timestamp_ns=1_700_000_000_123_456_789,
+        )
+
+        assert event.timestamp == datetime(2023, 11, 14, 22, 13, 20, 123456, tzinfo=timezone.utc)
+
+    def test_timestamp_from_datetime(self):
+        """Test building an event at a given datetime."""
+        when = datetime(2023, 11, 14, 22, 13, 20, 123456, tzinfo=timezone.utc)
+        event = Event.from_timestamp(
+            when,
+            event_type=EventType.PROJECT_CREATED,
+            agent_id="agent1",
+            entity_type="project",
+            entity_id="proj_123",
+        )
+
+        assert event.timestamp == when
+        assert event.timestamp_ns == 1_700_000_000_123_456_000
+
     def test_event_display_string(self):
         """Test event display string generation."""
         event = Event(
@@ -70,6 +97,53 @@ class TestEventModel:
         assert event.details["old_status"] == "todo"
         assert event.details["new_status"] == "in_progress"
 
+    def test_to_json(self):
+        """Test serializing an event to JSON."""
+        event = Event(
+            event_type=EventType.TASK_STATUS_CHANGED,
+            agent_id="agent1",
+            entity_type="task",
+            entity_id="task_123",
+            details={"new_status": "done"},
+        )
+
+        data = json.loads(event.to_json())
+
+        assert data["event_type"] == "task.status_changed"
+        assert data["details"] == {"new_status": "done"}
+        assert datetime.fromisoformat(data["timestamp"]) == event.timestamp
+
+    def test_model_validate_coerces_input(self):
+        """Test validating an event from external data."""
+        event = Event.model_validate(
+            {
+                "event_type": "task.created",
+                "agent_id": "agent1",
+                "entity_type": "task",
+                "entity_id": "task_123",
+            }
+        )
+
+        assert event.event_type == EventType.TASK_CREATED
+        assert isinstance(event.timestamp, datetime)
+
+        with pytest.raises(ValueError):
+            Event.model_validate({"event_type": "bogus", "agent_id": "agent1"})
+
+    def test_model_validate_round_trips_to_dict(self):
+        """Test that validating to_dict() output keeps the original timestamp."""
+        event = Event.from_timestamp(
+            "2023-11-14T22:13:20.123456+00:00",
+            event_type=EventType.TASK_CREATED,
+            agent_id="agent1",
+            entity_type="task",
+            entity_id="task_123",
+            entity_name="Task",
+            details={"story_id": "story_1"},
+        )
+
+        assert Event.model_validate(event.to_dict()) == event
+
 
 class TestEventQueue:
     """Test EventQueue functionality."""
@@ -121,6 +195,66 @@ class TestEventQueue:
         assert recent[0].entity_id == "task_9"
         assert recent[4].entity_id == "task_5"
 
+    def test_zero_maxlen_drops_events(self):
+        """Test that a zero-length queue accepts pushes and keeps nothing."""
+        queue = EventQueue(maxlen=0)
+        queue.push(
+            Event(
+                event_type=EventType.TASK_CREATED,
+                agent_id="agent1",
+                entity_type="task",
+                entity_id="task_1",
+            )
+        )
+
+        assert queue.get_recent() == []
+        assert queue.get_by_agent("agent1") == []
+
+        with pytest.raises(ValueError):
+            EventQueue(maxlen=-1)
+
+    def test_wraparound_keeps_order(self):
+        """Test ordering after the ring has wrapped several times."""
+        queue = EventQueue(maxlen=3)
+
+        for i in range(8):
+            queue.push(
+                Event(
+                    event_type=EventType.TASK_CREATED,
+                    agent_id="agent1",
+                    entity_type="task",
+                    entity_id=f"task_{i}",
+                )
+            )
+
+        assert [e.entity_id for e in queue.get_recent(limit=2)] == ["task_7", "task_6"]
+        assert [e.entity_id for e in queue.get_by_agent("agent1")] == [
+            "task_7",
+            "task_6",
+            "task_5",
+        ]
+
+    def test_latest_and_size(self):
+        """Test peeking at the newest event and counting held events."""
+        queue = EventQueue(maxlen=3)
+        assert queue.latest() is None
+        assert queue.size() == 0
+        # An empty queue is still truthy, so `queue or default` keeps it
+        assert queue
+
+        for i in range(5):
+            queue.push(
+                Event(
+                    event_type=EventType.TASK_CREATED,
+                    agent_id="agent1",
+                    entity_type="task",
+                    entity_id=f"task_{i}",
+                )
+            )
+
+        assert queue.latest().entity_id == "task_4"
+        assert queue.size() == 3
+
     def test_get_recent_with_limit(self):
         """Test limiting the number of recent events."""
         queue = EventQueue(maxlen=100)
@@ -219,6 +353,43 @@ class TestEventQueue:
         assert len(task_123_events) == 3
         assert all(e.entity_id == "task_123" for e in task_123_events)
 
+    def test_lookups_drop_evicted_events(self):
+        """Test that agent and entity lookups forget events pushed out of the queue."""
+        queue = EventQueue(maxlen=2)
+
+        pushes = [("agent1", "task_1"), ("agent2", "task_2"), ("agent2", "task_2")]
+        for agent_id, entity_id in pushes:
+            queue.push(
+                Event(
+                    event_type=EventType.TASK_UPDATED,
+                    agent_id=agent_id,
+                    entity_type="task",
+                    entity_id=entity_id,
+                )
+            )
+
+        assert queue.get_by_agent("agent1") == []
+        assert queue.get_by_entity("task", "task_1") == []
+        assert len(queue.get_by_agent("agent2")) == 2
+        assert len(queue.get_by_entity("task", "task_2")) == 2
+
+    def test_push_many(self):
+        """Test pushing a batch of events at once."""
+        queue = EventQueue(maxlen=3)
+
+        queue.push_many(
+            Event(
+                event_type=EventType.TASK_CREATED,
+                agent_id="agent1",
+                entity_type="task",
+                entity_id=f"task_{i}",
+            )
+            for i in range(4)
+        )
+
+        assert [e.entity_id for e in queue.get_recent()] == ["task_3", "task_2", "task_1"]
+        assert len(queue.get_by_agent("agent1")) == 3
+
     def test_clear(self):
         """Test clearing the queue."""
         queue = EventQueue(maxlen=100)
@@ -1,6 +1,7 @@
 """Tests for agentFlow data models."""
 
 from datetime import datetime, timezone
+from uuid import UUID
 
 import pytest
 from pydantic import ValidationError
@@ -74,6 +75,13 @@ class TestProject:
         errors = exc_info.value.errors()
         assert any(e["loc"] == ("name",) for e in errors)
 
+    def test_project_is_frozen(self):
+        """Test that stored project fields cannot be reassigned."""
+        project = Project(name="Test")
+
+        with pytest.raises(ValidationError):
+            project.name = "Renamed"
+
     def test_project_create(self):
         """Test ProjectCreate model."""
         project_create = ProjectCreate(name="New Project", description="Description")
@@ -374,6 +382,13 @@ class TestTask:
         errors = exc_info.value.errors()
         assert any("depends_on" in str(e) for e in errors)
 
+    def test_task_update_depends_on_unique_validation(self):
+        """Test that an update's depends_on must contain unique task IDs."""
+        with pytest.raises(ValidationError):
+            TaskUpdate(depends_on=["task-1", "task-1"])
+
+        assert TaskUpdate(depends_on=None).depends_on is None
+
     def test_task_create(self):
         """Test TaskCreate model."""
         task_create = TaskCreate(
@@ -591,4 +606,5 @@ class TestModelIDs:
         assert len(parts[0]) == 8
         assert len(parts[1]) == 4
         assert len(parts[4]) == 12
+        assert UUID(project.id).version == 4
 
@@ -1,11 +1,7 @@
 """Tests for store layer."""
 
-import tempfile
-from pathlib import Path
-
 import pytest
 
-from src.database import Database
 from src.models import (
     CommentCreate,
     EntityType,
@@ -25,13 +21,48 @@ from src.store import Store
 
 
 @pytest.fixture
-def temp_store():
-    """Create a temporary store for testing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        db_path = Path(tmpdir) / "test.db"
-        db = Database(db_path)
-        store = Store(db)
-        yield store
+def temp_store(shared_db):
+    """Create a store on the shared in-memory database, emptied after each test."""
+    yield Store(shared_db)
+    shared_db.clear()
+
+
+def _prd(project_id: str, title: str = "Test", **fields) -> PRDCreate:
+    """Build a PRDCreate with the defaults most tests use."""
+    return PRDCreate(
+        project_id=project_id, agent_id="agent", title=title, description="Test", **fields
+    )
+
+
+def _story(prd_id: str, title: str = "Test", **fields) -> StoryCreate:
+    """Build a StoryCreate with the defaults most tests use."""
+    return StoryCreate(prd_id=prd_id, agent_id="agent", title=title, description="Test", **fields)
+
+
+def _task(story_id: str, title: str = "Test", **fields) -> TaskCreate:
+    """Build a TaskCreate with the defaults most tests use."""
+    fields.setdefault("assigned_to", "agent")
+    return TaskCreate(
+        story_id=story_id, agent_id="agent", title=title, description="Test", **fields
+    )
+
+
+@pytest.fixture
+def project(temp_store):
+    """Create a project to attach PRDs to."""
+    return temp_store.create_project(ProjectCreate(name="Test"))
+
+
+@pytest.fixture
+def prd(temp_store, project):
+    """Create a PRD under the project fixture."""
+    return temp_store.create_prd(_prd(project.id, "Test PRD"))
+
+
+@pytest.fixture
+def story(temp_store, prd):
+    """Create a story under the PRD fixture."""
+    return temp_store.create_story(_story(prd.id, "Test Story"))
 
 
 class TestProjectOperations:
@@ -52,19 +83,21 @@ class TestProjectOperations:
         assert project.metadata["priority"] == "high"
         assert project.id is not None
 
-    def test_get_project_with_stats(self, temp_store):
-        """Test getting project with statistics."""
-        project_create = ProjectCreate(name="Test")
+    def test_create_project_copies_metadata(self, temp_store):
+        """Test that the created project does not share metadata with its input."""
+        project_create = ProjectCreate(name="Test", metadata={"tags": ["a"]})
         project = temp_store.create_project(project_create)
 
+        project_create.metadata["tags"].append("b")
+        project_create.metadata["priority"] = "high"
+
+        assert project.metadata == {"tags": ["a"]}
+
+    def test_get_project_with_stats(self, temp_store, project):
+        """Test getting project with statistics."""
         # Create some PRDs
         for i in range(2):
-            prd_create = PRDCreate(
-                project_id=project.id,
-                agent_id="agent",
-                title=f"PRD {i}",
-                description="Test",
-            )
+            prd_create = _prd(project.id, f"PRD {i}")
             temp_store.create_prd(prd_create)
 
         project_with_stats = temp_store.get_project(project.id)
@@ -80,7 +113,7 @@ class TestProjectOperations:
             temp_store.create_project(ProjectCreate(name=f"Project {i}"))
 
         projects = temp_store.list_projects()
-        assert len(projects) == 3
+        assert sorted(p.name for p in projects) == ["Project 0", "Project 1", "Project 2"]
 
     def test_update_project(self, temp_store):
         """Test updating a project."""
@@ -97,10 +130,8 @@ class TestProjectOperations:
 class TestPRDOperations:
     """Tests for PRD store operations."""
 
-    def test_create_prd(self, temp_store):
+    def test_create_prd(self, temp_store, project):
         """Test creating a PRD."""
-        project = temp_store.create_project(ProjectCreate(name="Test"))
-
         prd_create = PRDCreate(
             project_id=project.id,
             agent_id="po-agent",
@@ -116,38 +147,17 @@ class TestPRDOperations:
 
     def test_create_prd_invalid_project(self, temp_store):
         """Test creating PRD with non-existent project fails."""
-        prd_create = PRDCreate(
-            project_id="nonexistent",
-            agent_id="agent",
-            title="Test",
-            description="Test",
-        )
+        prd_create = _prd("nonexistent")
 
-        with pytest.raises(ValueError, match="Project .* not found"):
+        with pytest.raises(ValueError) as exc_info:
             temp_store.create_prd(prd_create)
+        assert str(exc_info.value) == "Project nonexistent not found"
 
-    def test_get_prd_with_stats(self, temp_store):
+    def test_get_prd_with_stats(self, temp_store, prd):
         """Test getting PRD with statistics."""
-        project = temp_store.create_project(ProjectCreate(name="Test"))
-        prd = temp_store.create_prd(
-            PRDCreate(
-                project_id=project.id,
-                agent_id="agent",
-                title="Test",
-                description="Test",
-            )
-        )
-
         # Create stories
         for i in range(3):
-            temp_store.create_story(
-                StoryCreate(
-                    prd_id=prd.id,
-                    agent_id="agent",
-                    title=f"Story {i}",
-                    description="Test",
-                )
-            )
+            temp_store.create_story(_story(prd.id, f"Story {i}"))
 
         prd_with_stats = temp_store.get_prd_with_stats(prd.id)
 
@@ -155,10 +165,8 @@ class TestPRDOperations:
         assert prd_with_stats.story_count == 3
         assert prd_with_stats.task_count == 0
 
-    def test_list_prds_filtered(self, temp_store):
+    def test_list_prds_filtered(self, temp_store, project):
         """Test listing PRDs with filters."""
-        project = temp_store.create_project(ProjectCreate(name="Test"))
-
         # Create PRDs with different statuses
         temp_store.create_prd(
             PRDCreate(
@@ -180,23 +188,15 @@ class TestPRDOperations:
 
         # Filter by status
         draft_prds = temp_store.list_prds(status="draft")
-        assert len(draft_prds) == 1
+        assert [p.title for p in draft_prds] == ["Draft PRD"]
 
         # Filter by creator
         agent1_prds = temp_store.list_prds(created_by="agent-1")
-        assert len(agent1_prds) == 1
+        assert [p.title for p in agent1_prds] == ["Draft PRD"]
 
-    def test_update_prd(self, temp_store):
+    def test_update_prd(self, temp_store, project):
         """Test updating a PRD."""
-        project = temp_store.create_project(ProjectCreate(name="Test"))
-        prd = temp_store.create_prd(
-            PRDCreate(
-                project_id=project.id,
-                agent_id="agent",
-                title="Original",
-                description="Test",
-            )
-        )
+        prd = temp_store.create_prd(_prd(project.id, "Original"))
 
         update = PRDUpdate(title="Updated", status=PRDStatus.ACTIVE)
         updated = temp_store.update_prd(prd.id, update)
@@ -209,18 +209,8 @@ class TestPRDOperations:
 class TestStoryOperations:
     """Tests for Story store operations."""
 
-    def test_create_story(self, temp_store):
+    def test_create_story(self, temp_store, prd):
         """Test creating a story."""
-        project = temp_store.create_project(ProjectCreate(name="Test"))
-        prd = temp_store.create_prd(
-            PRDCreate(
-                project_id=project.id,
-                agent_id="agent",
-                title="Test",
-                description="Test",
-            )
-        )
-
         story_create = StoryCreate(
             prd_id=prd.id,
             agent_id="agent",
@@ -237,50 +227,21 @@ class TestStoryOperations:
 
     def test_create_story_invalid_prd(self, temp_store):
         """Test creating story with non-existent PRD fails."""
-        story_create = StoryCreate(
-            prd_id="nonexistent",
-            agent_id="agent",
-            title="Test",
-            description="Test",
-        )
+        story_create = _story("nonexistent")
 
-        with pytest.raises(ValueError, match="PRD .* not found"):
+        with pytest.raises(ValueError) as exc_info:
             temp_store.create_story(story_create)
+        assert str(exc_info.value) == "PRD nonexistent not found"
 
-    def test_get_story_with_stats(self, temp_store):
+    def test_get_story_with_stats(self, temp_store, story):
         """Test getting story with statistics."""
-        project = temp_store.create_project(ProjectCreate(name="Test"))
-        prd = temp_store.create_prd(
-            PRDCreate(
-                project_id=project.id,
-                agent_id="agent",
-                title="Test",
-                description="Test",
-            )
-        )
-        story = temp_store.create_story(
-            StoryCreate(
-                prd_id=prd.id,
-                agent_id="agent",
-                title="Test",
-                description="Test",
-            )
-        )
-
-        # Create tasks
-        for i in range(5):
-            task = temp_store.create_task(
-                TaskCreate(
-                    story_id=story.id,
-                    agent_id="agent",
-                    title=f"Task {i}",
-                    description="Test",
-                    assigned_to="agent",
-                )
-            )
-            # Update first 2 tasks to DONE
-            if i < 2:
-                temp_store.update_task(task.id, TaskUpdate(status=TaskStatus.DONE))
+        with temp_store.transaction():
+            # Create tasks
+            for i in range(5):
+                task = temp_store.create_task(_task(story.id, f"Task {i}"))
+                # Update first 2 tasks to DONE
+                if i < 2:
+                    temp_store.update_task(task.id, TaskUpdate(status=TaskStatus.DONE))
 
         story_with_stats = temp_store.get_story_with_stats(story.id)
 
@@ -288,62 +249,19 @@ class TestStoryOperations:
         assert story_with_stats.task_count == 5
         assert story_with_stats.completed_tasks == 2
 
-    def test_list_stories_filtered(self, temp_store):
+    def test_list_stories_filtered(self, temp_store, prd):
         """Test listing stories with filters."""
-        project = temp_store.create_project(ProjectCreate(name="Test"))
-        prd = temp_store.create_prd(
-            PRDCreate(
-                project_id=project.id,
-                agent_id="agent",
-                title="Test",
-                description="Test",
-            )
-        )
-
         # Create stories with different assignments
-        temp_store.create_story(
-            StoryCreate(
-                prd_id=prd.id,
-                agent_id="agent",
-                title="Story 1",
-                description="Test",
-                assigned_to="agent-1",
-            )
-        )
-        temp_store.create_story(
-            StoryCreate(
-                prd_id=prd.id,
-                agent_id="agent",
-                title="Story 2",
-                description="Test",
-                assigned_to="agent-2",
-            )
-        )
+        temp_store.create_story(_story(prd.id, "Story 1", assigned_to="agent-1"))
+        temp_store.create_story(_story(prd.id, "Story 2", assigned_to="agent-2"))
 
         # Filter by assignment
         agent1_stories = temp_store.list_stories(assigned_to="agent-1")
-        assert len(agent1_stories) == 1
-        assert agent1_stories[0].title == "Story 1"
+        assert [s.title for s in agent1_stories] == ["Story 1"]
 
-    def test_update_story(self, temp_store):
+    def test_update_story(self, temp_store, prd):
         """Test updating a story."""
-        project = temp_store.create_project(ProjectCreate(name="Test"))
-        prd = temp_store.create_prd(
-            PRDCreate(
-                project_id=project.id,
-                agent_id="agent",
-                title="Test",
-                description="Test",
-            )
-        )
-        story = temp_store.create_story(
-            StoryCreate(
-                prd_id=prd.id,
-                agent_id="agent",
-                title="Original",
-                description="Test",
-            )
-        )
+        story = temp_store.create_story(_story(prd.id, "Original"))
 
         update = StoryUpdate(title="Updated", status=StoryStatus.IN_PROGRESS)
         updated = temp_store.update_story(story.id, update)
@@ -356,26 +274,8 @@ class TestStoryOperations:
 class TestTaskOperations:
     """Tests for Task store operations."""
 
-    def test_create_task(self, temp_store):
+    def test_create_task(self, temp_store, story):
         """Test creating a task."""
-        project = temp_store.create_project(ProjectCreate(name="Test"))
-        prd = temp_store.create_prd(
-            PRDCreate(
-                project_id=project.id,
-                agent_id="agent",
-                title="Test",
-                description="Test",
-            )
-        )
-        story = temp_store.create_story(
-            StoryCreate(
-                prd_id=prd.id,
-                agent_id="agent",
-                title="Test",
-                description="Test",
-            )
-        )
-
         task_create = TaskCreate(
             story_id=story.id,
             agent_id="agent",
@@ -392,120 +292,72 @@ class TestTaskOperations:
 
     def test_create_task_invalid_story(self, temp_store):
         """Test creating task with non-existent story fails."""
-        task_create = TaskCreate(
-            story_id="nonexistent",
-            agent_id="agent",
-            title="Test",
-            description="Test",
-            assigned_to="agent",
-        )
+        task_create = _task("nonexistent")
 
-        with pytest.raises(ValueError, match="Story .* not found"):
+        with pytest.raises(ValueError) as exc_info:
             temp_store.create_task(task_create)
+        assert str(exc_info.value) == "Story nonexistent not found"
 
-    def test_create_task_with_dependencies(self, temp_store):
-        """Test creating a task with dependencies."""
-        project = temp_store.create_project(ProjectCreate(name="Test"))
-        prd = temp_store.create_prd(
-            PRDCreate(
-                project_id=project.id,
-                agent_id="agent",
-                title="Test",
-                description="Test",
-            )
-        )
-        story = temp_store.create_story(
-            StoryCreate(
-                prd_id=prd.id,
-                agent_id="agent",
-                title="Test",
-                description="Test",
-            )
-        )
+    def test_create_task_missing_story_reported_before_dependency(self, temp_store):
+        """Test that a missing story is reported ahead of a missing dependency."""
+        task_create = _task("nonexistent", depends_on=["missing-task"])
 
-        task1 = temp_store.create_task(
-            TaskCreate(
-                story_id=story.id,
-                agent_id="agent",
-                title="Task 1",
-                description="Test",
-                assigned_to="agent",
-            )
-        )
+        with pytest.raises(ValueError) as exc_info:
+            temp_store.create_task(task_create)
+        assert str(exc_info.value) == "Story nonexistent not found"
 
-        task2 = temp_store.create_task(
-            TaskCreate(
-                story_id=story.id,
-                agent_id="agent",
-                title="Task 2",
-                description="Test",
-                assigned_to="agent",
-                depends_on=[task1.id],
-            )
-        )
+    def test_create_task_with_dependencies(self, temp_store, story):
+        """Test creating a task with dependencies."""
+        task1 = temp_store.create_task(_task(story.id, "Task 1"))
+
+        task_create = _task(story.id, "Task 2", depends_on=[task1.id])
+        task2 = temp_store.create_task(task_create)
+        task_create.depends_on.clear()
 
         assert task2.depends_on == [task1.id]
 
-    def test_create_task_invalid_dependency(self, temp_store):
+    def test_create_task_invalid_dependency(self, temp_store, story):
         """Test creating task with non-existent dependency fails."""
-        project = temp_store.create_project(ProjectCreate(name="Test"))
-        prd = temp_store.create_prd(
-            PRDCreate(
-                project_id=project.id,
-                agent_id="agent",
-                title="Test",
-                description="Test",
-            )
-        )
-        story = temp_store.create_story(
-            StoryCreate(
-                prd_id=prd.id,
-                agent_id="agent",
-                title="Test",
-                description="Test",
-            )
-        )
+        task_create = _task(story.id, depends_on=["nonexistent"])
 
-        task_create = TaskCreate(
-            story_id=story.id,
-            agent_id="agent",
-            title="Test",
-            description="Test",
-            assigned_to="agent",
-            depends_on=["nonexistent"],
+        with pytest.raises(ValueError) as exc_info:
+            temp_store.create_task(task_create)
+        assert str(exc_info.value) == "Dependency task nonexistent not found"
+        assert temp_store.list_tasks(story_id=story.id) == []
+
+    def test_create_task_invalid_dependency_in_transaction(self, temp_store, story):
+        """Test that a rejected task leaves no row in an enclosing transaction."""
+        with temp_store.transaction():
+            with pytest.raises(ValueError):
+                temp_store.create_task(_task(story.id, depends_on=["nonexistent"]))
+            temp_store.create_task(_task(story.id, "Kept"))
+
+        assert [t.title for t in temp_store.list_tasks(story_id=story.id)] == ["Kept"]
+
+    def test_create_tasks(self, temp_store, story):
+        """Test creating several tasks in one batch."""
+        first = temp_store.create_task(_task(story.id, "First"))
+
+        tasks = temp_store.create_tasks(
+            [_task(story.id, f"Task {i}", depends_on=[first.id]) for i in range(3)]
         )
 
-        with pytest.raises(ValueError, match="Dependency task .* not found"):
-            temp_store.create_task(task_create)
+        assert [t.title for t in tasks] == ["Task 0", "Task 1", "Task 2"]
+        assert len(temp_store.list_tasks(story_id=story.id)) == 4
+
+    def test_create_tasks_invalid_story(self, temp_store, story):
+        """Test that one bad parent rejects the whole batch."""
+        task_creates = [_task(story_id) for story_id in [story.id, "nonexistent"]]
 
-    def test_update_task(self, temp_store):
+        with pytest.raises(ValueError) as exc_info:
+            temp_store.create_tasks(task_creates)
+        assert str(exc_info.value) == "Story nonexistent not found"
+
+        assert temp_store.list_tasks(story_id=story.id) == []
+
+    def test_update_task(self, temp_store, story):
         """Test updating a task."""
-        project = temp_store.create_project(ProjectCreate(name="Test"))
-        prd = temp_store.create_prd(
-            PRDCreate(
-                project_id=project.id,
-                agent_id="agent",
-                title="Test",
-                description="Test",
-            )
-        )
-        story = temp_store.create_story(
-            StoryCreate(
-                prd_id=prd.id,
-                agent_id="agent",
-                title="Test",
-                description="Test",
-            )
-        )
-        task = temp_store.create_task(
-            TaskCreate(
-                story_id=story.id,
-                agent_id="agent",
-                title="Original",
-                description="Test",
-                assigned_to="agent",
-            )
-        )
+        task = temp_store.create_task(_task(story.id, "Original"))
 
         update = TaskUpdate(title="Updated", status=TaskStatus.DONE)
         updated = temp_store.update_task(task.id, update)
@@ -514,96 +366,43 @@ class TestTaskOperations:
         assert updated.title == "Updated"
         assert updated.status == TaskStatus.DONE
 
-    def test_get_agent_workload(self, temp_store):
-        """Test getting agent workload."""
-        project = temp_store.create_project(ProjectCreate(name="Test"))
-        prd = temp_store.create_prd(
-            PRDCreate(
-                project_id=project.id,
-                agent_id="agent",
-                title="Test PRD",
-                description="Test",
-            )
+    def test_update_task_statuses(self, temp_store, story):
+        """Test batch status updates with enum and plain-string statuses."""
+        first, second = temp_store.create_tasks(
+            [_task(story.id, "First"), _task(story.id, "Second")]
         )
-        story = temp_store.create_story(
-            StoryCreate(
-                prd_id=prd.id,
-                agent_id="agent",
-                title="Test Story",
-                description="Test",
-            )
+
+        updated = temp_store.update_task_statuses(
+            [(first.id, TaskStatus.DONE), (second.id, "blocked"), ("nonexistent", "done")]
         )
 
+        assert updated == [first.id, second.id]
+        assert temp_store.get_task(first.id).status == TaskStatus.DONE
+        assert temp_store.get_task(second.id).status == TaskStatus.BLOCKED
+
+    def test_get_agent_workload(self, temp_store, story):
+        """Test getting agent workload."""
         # Create tasks for different agents
         for i in range(3):
-            temp_store.create_task(
-                TaskCreate(
-                    story_id=story.id,
-                    agent_id="agent",
-                    title=f"Task {i}",
-                    description="Test",
-                    assigned_to="agent-1",
-                )
-            )
-        temp_store.create_task(
-            TaskCreate(
-                story_id=story.id,
-                agent_id="agent",
-                title="Other Task",
-                description="Test",
-                assigned_to="agent-2",
-            )
-        )
+            temp_store.create_task(_task(story.id, f"Task {i}", assigned_to="agent-1"))
+        temp_store.create_task(_task(story.id, "Other Task", assigned_to="agent-2"))
 
         # Get workload for agent-1
         workload = temp_store.get_agent_workload("agent-1")
 
         assert len(workload) == 3
-        assert all(t.assigned_to == "agent-1" for t in workload)
-        assert all(hasattr(t, "story_title") for t in workload)
-        assert all(hasattr(t, "prd_title") for t in workload)
-        assert workload[0].story_title == "Test Story"
-        assert workload[0].prd_title == "Test PRD"
-
-    def test_get_agent_workload_filtered_by_status(self, temp_store):
-        """Test getting agent workload filtered by status."""
-        project = temp_store.create_project(ProjectCreate(name="Test"))
-        prd = temp_store.create_prd(
-            PRDCreate(
-                project_id=project.id,
-                agent_id="agent",
-                title="Test",
-                description="Test",
-            )
-        )
-        story = temp_store.create_story(
-            StoryCreate(
-                prd_id=prd.id,
-                agent_id="agent",
-                title="Test",
-                description="Test",
+        for t in workload:
+            assert (t.assigned_to, t.story_title, t.prd_title) == (
+                "agent-1",
+                "Test Story",
+                "Test PRD",
             )
-        )
 
+    def test_get_agent_workload_filtered_by_status(self, temp_store, story):
+        """Test getting agent workload filtered by status."""
         # Create tasks with different statuses
-        temp_store.create_task(
-            TaskCreate(
-                story_id=story.id,
-                agent_id="agent",
-                title="Todo Task",
-                description="Test",
-                assigned_to="agent-1",
-            )
-        )
-        task2 = temp_store.create_task(
-            TaskCreate(
-                story_id=story.id,
-                agent_id="agent",
-                title="Done Task",
-                description="Test",
-                assigned_to="agent-1",
-            )
-        )
+        temp_store.create_task(_task(story.id, "Todo Task", assigned_to="agent-1"))
+        task2 = temp_store.create_task(_task(story.id, "Done Task", assigned_to="agent-1"))
         # Update second task to DONE
         temp_store.update_task(task2.id, TaskUpdate(status=TaskStatus.DONE))
 
@@ -617,34 +416,9 @@ class TestTaskOperations:
 class TestCommentOperations:
     """Tests for Comment store operations."""
 
-    def test_add_comment_to_task(self, temp_store):
+    def test_add_comment_to_task(self, temp_store, story):
         """Test adding a comment to a task."""
-        project = temp_store.create_project(ProjectCreate(name="Test"))
-        prd = temp_store.create_prd(
-            PRDCreate(
-                project_id=project.id,
-                agent_id="agent",
-                title="Test",
-                description="Test",
-            )
-        )
-        story = temp_store.create_story(
-            StoryCreate(
-                prd_id=prd.id,
-                agent_id="agent",
-                title="Test",
-                description="Test",
-            )
-        )
-        task = temp_store.create_task(
-            TaskCreate(
-                story_id=story.id,
-                agent_id="agent",
-                title="Test",
-                description="Test",
-                assigned_to="agent",
-            )
-        )
+        task = temp_store.create_task(_task(story.id))
 
         comment_create = CommentCreate(
             entity_type=EntityType.TASK,
@@ -667,21 +441,12 @@ class TestCommentOperations:
             content="Test",
         )
 
-        with pytest.raises(ValueError, match="task .* not found"):
+        with pytest.raises(ValueError) as exc_info:
             temp_store.add_comment(comment_create)
+        assert str(exc_info.value) == "task nonexistent not found"
 
-    def test_get_comments(self, temp_store):
+    def test_get_comments(self, temp_store, prd):
         """Test getting comments for an entity."""
-        project = temp_store.create_project(ProjectCreate(name="Test"))
-        prd = temp_store.create_prd(
-            PRDCreate(
-                project_id=project.id,
-                agent_id="agent",
-                title="Test",
-                description="Test",
-            )
-        )
-
         # Add multiple comments
         for i in range(3):
             temp_store.add_comment(
@@ -701,79 +466,22 @@ class TestCommentOperations:
 class TestProgressTracking:
     """Tests for progress tracking."""
 
-    def test_get_story_progress(self, temp_store):
+    def test_get_story_progress(self, temp_store, story):
         """Test getting story progress."""
-        project = temp_store.create_project(ProjectCreate(name="Test"))
-        prd = temp_store.create_prd(
-            PRDCreate(
-                project_id=project.id,
-                agent_id="agent",
-                title="Test",
-                description="Test",
-            )
-        )
-        story = temp_store.create_story(
-            StoryCreate(
-                prd_id=prd.id,
-                agent_id="agent",
-                title="Test",
-                description="Test",
-            )
-        )
-
         # Create tasks with different statuses
-        task1 = temp_store.create_task(
-            TaskCreate(
-                story_id=story.id,
-                agent_id="agent",
-                title="Done 1",
-                description="Test",
-                assigned_to="agent",
-            )
-        )
-        temp_store.update_task(task1.id, TaskUpdate(status=TaskStatus.DONE))
-
-        task2 = temp_store.create_task(
-            TaskCreate(
-                story_id=story.id,
-                agent_id="agent",
-                title="Done 2",
-                description="Test",
-                assigned_to="agent",
-            )
-        )
-        temp_store.update_task(task2.id, TaskUpdate(status=TaskStatus.DONE))
-
-        task3 = temp_store.create_task(
-            TaskCreate(
-                story_id=story.id,
-                agent_id="agent",
-                title="In Progress",
-                description="Test",
-                assigned_to="agent",
-            )
-        )
-        temp_store.update_task(task3.id, TaskUpdate(status=TaskStatus.IN_PROGRESS))
-
-        task4 = temp_store.create_task(
-            TaskCreate(
-                story_id=story.id,
-                agent_id="agent",
-                title="Blocked",
-                description="Test",
-                assigned_to="agent",
-            )
+        tasks = temp_store.create_tasks(
+            [
+                _task(story.id, title)
+                for title in ["Done 1", "Done 2", "In Progress", "Blocked", "Todo"]
+            ]
         )
-        temp_store.update_task(task4.id, TaskUpdate(status=TaskStatus.BLOCKED))
-
-        temp_store.create_task(
-            TaskCreate(
-                story_id=story.id,
-                agent_id="agent",
-                title="Todo",
-                description="Test",
-                assigned_to="agent",
-            )
+        temp_store.update_task_statuses(
+            [
+                (tasks[0].id, TaskStatus.DONE),
+                (tasks[1].id, TaskStatus.DONE),
+                (tasks[2].id, TaskStatus.IN_PROGRESS),
+                (tasks[3].id, TaskStatus.BLOCKED),
+            ]
         )
 
         progress = temp_store.get_story_progress(story.id)
@@ -785,54 +493,29 @@ class TestProgressTracking:
         assert progress.blocked_tasks == 1
         assert progress.completion_percentage == 40.0
 
-    def test_get_project_progress(self, temp_store):
+    def test_get_project_progress(self, temp_store, project):
         """Test getting project progress."""
-        project = temp_store.create_project(ProjectCreate(name="Test"))
-
-        # Create 2 PRDs
-        for i in range(2):
-            prd = temp_store.create_prd(
-                PRDCreate(
-                    project_id=project.id,
-                    agent_id="agent",
-                    title=f"PRD {i}",
-                    description="Test",
-                )
-            )
-
-            # Create 2 stories per PRD
-            for j in range(2):
-                story = temp_store.create_story(
-                    StoryCreate(
-                        prd_id=prd.id,
-                        agent_id="agent",
-                        title=f"Story {j}",
-                        description="Test",
-                    )
-                )
-
-                # Create 3 tasks per story (1 done, 2 todo)
-                task_done = temp_store.create_task(
-                    TaskCreate(
-                        story_id=story.id,
-                        agent_id="agent",
-                        title="Done Task",
-                        description="Test",
-                        assigned_to="agent-1",
-                    )
-                )
-                temp_store.update_task(task_done.id, TaskUpdate(status=TaskStatus.DONE))
-
-                for k in range(2):
-                    temp_store.create_task(
-                        TaskCreate(
-                            story_id=story.id,
-                            agent_id="agent",
-                            title=f"Todo Task {k}",
-                            description="Test",
-                            assigned_to="agent-2",
-                        )
+        with temp_store.transaction():
+            # Create 2 PRDs
+            for i in range(2):
+                prd = temp_store.create_prd(_prd(project.id, f"PRD {i}"))
+
+                # Create 2 stories per PRD
+                for j in range(2):
+                    story = temp_store.create_story(_story(prd.id, f"Story {j}"))
+
+                    # Create 3 tasks per story (1 done, 2 todo)
+                    task_done, *_ = temp_store.create_tasks(
+                        [
+                            _task(story.id, title, assigned_to=assigned_to)
+                            for title, assigned_to in [
+                                ("Done Task", "agent-1"),
+                                ("Todo Task 0", "agent-2"),
+                                ("Todo Task 1", "agent-2"),
+                            ]
+                        ]
                     )
+                    temp_store.update_task(task_done.id, TaskUpdate(status=TaskStatus.DONE))
 
         progress = temp_store.get_project_progress(project.id)
 
@@ -844,6 +527,6 @@ class TestProgressTracking:
         assert progress.tasks_by_status["todo"] == 8
         assert progress.tasks_by_agent["agent-1"] == 4
         assert progress.tasks_by_agent["agent-2"] == 8
-        # 4 done out of 12 = 33.33%
-        assert abs(progress.completion_percentage - 33.33) < 0.1
+        # 4 done out of 12
+        assert progress.completion_percentage == pytest.approx(100 * 4 / 12)
 
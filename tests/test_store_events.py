@@ -1,319 +1,281 @@
 """Tests for store event emission."""
 
-import tempfile
-from pathlib import Path
+from operator import attrgetter
 
 import pytest
 
-from src.database import Database
 from src.events import EventType, get_event_queue
 from src.models import PRDCreate, ProjectCreate, StoryCreate, TaskCreate
 from src.store import Store
 
 
 @pytest.fixture
-def store():
-    """Create a store with temporary database."""
-    # Create temp file for DB
-    fd, path = tempfile.mkstemp(suffix=".db")
-    db_path = Path(path)
-    
-    db = Database(db_path)
-    yield Store(db)
-    
-    # Cleanup
-    db_path.unlink(missing_ok=True)
+def store(shared_db):
+    """Create a store on the shared in-memory database, emptied after each test."""
+    yield Store(shared_db)
+    shared_db.clear()
+
+
+class EntityFactory:
+    """Build project -> PRD -> story -> task chains through a store."""
+
+    def __init__(self, store):
+        self.store = store
+
+    def make_project(self, name="Project 1", agent_id="system"):
+        project_create = ProjectCreate.model_construct(name=name)
+        return self.store.create_project(project_create, agent_id=agent_id)
+
+    def make_prd(self, project, title="PRD 1", agent_id="system"):
+        prd_create = PRDCreate.model_construct(
+            project_id=project.id,
+            agent_id=agent_id,
+            title=title,
+            description=f"{title} description",
+        )
+        return self.store.create_prd(prd_create, agent_id=agent_id)
+
+    def make_story(self, prd, title="Story 1", agent_id="system"):
+        story_create = StoryCreate.model_construct(
+            prd_id=prd.id,
+            agent_id=agent_id,
+            title=title,
+            description=f"{title} description",
+        )
+        return self.store.create_story(story_create, agent_id=agent_id)
+
+    def make_task(self, story, title="Task 1", agent_id="system"):
+        task_create = TaskCreate.model_construct(
+            story_id=story.id,
+            agent_id=agent_id,
+            title=title,
+            description=f"{title} description",
+            assigned_to=agent_id,
+        )
+        return self.store.create_task(task_create, agent_id=agent_id)
+
+
+@pytest.fixture
+def factory(store):
+    """Create an entity factory on the test store."""
+    return EntityFactory(store)
 
 
 @pytest.fixture(autouse=True)
-def clear_events():
-    """Clear events before each test."""
+def events():
+    """Yield the global event queue, cleared before and after each test."""
     queue = get_event_queue()
     queue.clear()
-    yield
+    yield queue
     queue.clear()
 
 
-class TestProjectEvents:
-    """Test that project operations emit events."""
+def _build_parents(factory, entity_type):
+    """Create the ancestors an entity of the given type needs, keyed by parent field."""
+    parents = {}
+    if entity_type == "project":
+        return parents
+    project = factory.make_project()
+    parents["project_id"] = project.id
+    if entity_type == "prd":
+        return parents
+    prd = factory.make_prd(project)
+    parents["prd_id"] = prd.id
+    if entity_type == "story":
+        return parents
+    parents["story_id"] = factory.make_story(prd).id
+    return parents
 
-    def test_create_project_emits_event(self, store):
-        """Test that creating a project emits an event."""
-        events = get_event_queue()
-        
-        project_create = ProjectCreate(
-            name="Test Project",
-            description="Test description",
-        )
-        
-        project = store.create_project(project_create, agent_id="test_agent")
-        
-        recent = events.get_recent(limit=10)
-        assert len(recent) == 1
-        
-        event = recent[0]
-        assert event.event_type == EventType.PROJECT_CREATED
-        assert event.agent_id == "test_agent"
-        assert event.entity_type == "project"
-        assert event.entity_id == project.id
-        assert event.entity_name == "Test Project"
 
-    def test_create_project_default_agent(self, store):
-        """Test that creating a project uses default agent_id."""
-        events = get_event_queue()
-        
-        project_create = ProjectCreate(name="Test Project")
-        project = store.create_project(project_create)
-        
-        recent = events.get_recent(limit=10)
-        assert len(recent) == 1
-        assert recent[0].agent_id == "system"
-
-
-class TestPRDEvents:
-    """Test that PRD operations emit events."""
-
-    def test_create_prd_emits_event(self, store):
-        """Test that creating a PRD emits an event."""
-        events = get_event_queue()
-        
-        # Create project first
-        project = store.create_project(ProjectCreate(name="Project 1"))
-        
-        # Clear events from project creation
-        events.clear()
-        
-        prd_create = PRDCreate(
-            project_id=project.id,
-            agent_id="agent1",
+CREATE_CASES = [
+    pytest.param(
+        "project",
+        lambda parents: ProjectCreate.model_construct(
+            name="Test Project", description="Test description"
+        ),
+        EventType.PROJECT_CREATED,
+        "Test Project",
+        lambda parents: {"description": "Test description"},
+        id="project",
+    ),
+    pytest.param(
+        "prd",
+        lambda parents: PRDCreate.model_construct(
+            project_id=parents["project_id"],
+            agent_id="test_agent",
             title="Test PRD",
             description="PRD description",
-        )
-        
-        prd = store.create_prd(prd_create, agent_id="agent1")
-        
-        recent = events.get_recent(limit=10)
-        assert len(recent) == 1
-        
-        event = recent[0]
-        assert event.event_type == EventType.PRD_CREATED
-        assert event.agent_id == "agent1"
-        assert event.entity_type == "prd"
-        assert event.entity_id == prd.id
-        assert event.entity_name == "Test PRD"
-        assert event.details["project_id"] == project.id
-        assert event.details["status"] == "draft"
-
-
-class TestStoryEvents:
-    """Test that story operations emit events."""
-
-    def test_create_story_emits_event(self, store):
-        """Test that creating a story emits an event."""
-        events = get_event_queue()
-        
-        # Setup
-        project = store.create_project(ProjectCreate(name="Project 1"))
-        prd = store.create_prd(
-            PRDCreate(
-                project_id=project.id,
-                agent_id="agent1",
-                title="PRD 1",
-                description="PRD description",
-            )
-        )
-        
-        events.clear()
-        
-        story_create = StoryCreate(
-            prd_id=prd.id,
-            agent_id="agent2",
+        ),
+        EventType.PRD_CREATED,
+        "Test PRD",
+        lambda parents: {"project_id": parents["project_id"], "status": "draft"},
+        id="prd",
+    ),
+    pytest.param(
+        "story",
+        lambda parents: StoryCreate.model_construct(
+            prd_id=parents["prd_id"],
+            agent_id="test_agent",
             title="Test Story",
             description="Story description",
-        )
-        
-        story = store.create_story(story_create, agent_id="agent2")
-        
-        recent = events.get_recent(limit=10)
-        assert len(recent) == 1
-        
-        event = recent[0]
-        assert event.event_type == EventType.STORY_CREATED
-        assert event.agent_id == "agent2"
-        assert event.entity_type == "story"
-        assert event.entity_id == story.id
-        assert event.entity_name == "Test Story"
-        assert event.details["prd_id"] == prd.id
-
-
-class TestTaskEvents:
-    """Test that task operations emit events."""
-
-    def test_create_task_emits_event(self, store):
-        """Test that creating a task emits an event."""
-        events = get_event_queue()
-        
-        # Setup
-        project = store.create_project(ProjectCreate(name="Project 1"))
-        prd = store.create_prd(
-            PRDCreate(
-                project_id=project.id,
-                agent_id="agent1",
-                title="PRD 1",
-                description="PRD description",
-            )
-        )
-        story = store.create_story(
-            StoryCreate(
-                prd_id=prd.id,
-                agent_id="agent1",
-                title="Story 1",
-                description="Story description",
-            )
-        )
-        
-        events.clear()
-        
-        task_create = TaskCreate(
-            story_id=story.id,
-            agent_id="agent3",
+        ),
+        EventType.STORY_CREATED,
+        "Test Story",
+        lambda parents: {"prd_id": parents["prd_id"], "status": "todo"},
+        id="story",
+    ),
+    pytest.param(
+        "task",
+        lambda parents: TaskCreate.model_construct(
+            story_id=parents["story_id"],
+            agent_id="test_agent",
             title="Test Task",
             description="Task description",
             assigned_to="agent3",
-        )
-        
-        task = store.create_task(task_create, agent_id="agent3")
-        
-        recent = events.get_recent(limit=10)
-        assert len(recent) == 1
-        
-        event = recent[0]
-        assert event.event_type == EventType.TASK_CREATED
-        assert event.agent_id == "agent3"
-        assert event.entity_type == "task"
-        assert event.entity_id == task.id
-        assert event.entity_name == "Test Task"
-        assert event.details["story_id"] == story.id
-        assert event.details["assigned_to"] == "agent3"
+        ),
+        EventType.TASK_CREATED,
+        "Test Task",
+        lambda parents: {"story_id": parents["story_id"], "assigned_to": "agent3"},
+        id="task",
+    ),
+]
+
+
+class TestCreateEvents:
+    """Test that create operations emit events."""
+
+    @pytest.mark.parametrize(
+        "entity_type,make_create,event_type,entity_name,make_details", CREATE_CASES
+    )
+    def test_create_emits_event(
+        self,
+        store,
+        factory,
+        events,
+        entity_type,
+        make_create,
+        event_type,
+        entity_name,
+        make_details,
+    ):
+        """Test that creating an entity emits a single matching event."""
+        parents = _build_parents(factory, entity_type)
+
+        # Only the event for the entity under test should be seen
+        events.clear()
+
+        create = getattr(store, f"create_{entity_type}")
+        entity = create(make_create(parents), agent_id="test_agent")
+
+        assert events.size() == 1
+
+        event = events.latest()
+        assert event.event_type == event_type
+        assert event.agent_id == "test_agent"
+        assert event.entity_type == entity_type
+        assert event.entity_id == entity.id
+        assert event.entity_name == entity_name
+        assert event.details == make_details(parents)
+
+    def test_create_project_default_agent(self, store, events):
+        """Test that creating a project uses default agent_id."""
+        project_create = ProjectCreate.model_construct(name="Test Project")
+        store.create_project(project_create)
+
+        assert events.size() == 1
+        assert events.latest().agent_id == "system"
 
 
 class TestMultipleEvents:
     """Test multiple operations create multiple events."""
 
-    def test_full_workflow_emits_events(self, store):
+    def test_full_workflow_emits_events(self, store, factory, events):
         """Test that a complete workflow emits all expected events."""
-        events = get_event_queue()
-        
-        # Create project
-        project = store.create_project(
-            ProjectCreate(name="Full Workflow"),
-            agent_id="pm_agent",
-        )
-        
-        # Create PRD
-        prd = store.create_prd(
-            PRDCreate(
-                project_id=project.id,
-                agent_id="pm_agent",
-                title="Feature PRD",
-                description="Feature description",
-            ),
-            agent_id="pm_agent",
-        )
-        
-        # Create story
-        story = store.create_story(
-            StoryCreate(
-                prd_id=prd.id,
-                agent_id="dev_agent",
-                title="User Story",
-                description="Story description",
-            ),
-            agent_id="dev_agent",
-        )
-        
-        # Create tasks
-        task1 = store.create_task(
-            TaskCreate(
-                story_id=story.id,
-                agent_id="dev_agent",
-                title="Task 1",
-                description="Task 1 description",
-                assigned_to="dev_agent",
-            ),
-            agent_id="dev_agent",
-        )
-        
-        task2 = store.create_task(
-            TaskCreate(
-                story_id=story.id,
+        # One transaction for the whole chain; both tasks go in as one batch
+        with store.transaction():
+            project = factory.make_project("Full Workflow", agent_id="pm_agent")
+            prd = factory.make_prd(project, "Feature PRD", agent_id="pm_agent")
+            story = factory.make_story(prd, "User Story", agent_id="dev_agent")
+            store.create_tasks(
+                [
+                    TaskCreate.model_construct(
+                        story_id=story.id,
+                        agent_id="dev_agent",
+                        title=f"Task {i}",
+                        description=f"Task {i} description",
+                        assigned_to="dev_agent",
+                    )
+                    for i in (1, 2)
+                ],
                 agent_id="dev_agent",
-                title="Task 2",
-                description="Task 2 description",
-                assigned_to="dev_agent",
-            ),
-            agent_id="dev_agent",
-        )
-        
+            )
+
         # Check all events
-        recent = events.get_recent(limit=100)
-        assert len(recent) == 5
-        
-        # Verify event types (newest first)
-        assert recent[0].event_type == EventType.TASK_CREATED
-        assert recent[0].entity_name == "Task 2"
-        
-        assert recent[1].event_type == EventType.TASK_CREATED
-        assert recent[1].entity_name == "Task 1"
-        
-        assert recent[2].event_type == EventType.STORY_CREATED
-        assert recent[2].entity_name == "User Story"
-        
-        assert recent[3].event_type == EventType.PRD_CREATED
-        assert recent[3].entity_name == "Feature PRD"
-        
-        assert recent[4].event_type == EventType.PROJECT_CREATED
-        assert recent[4].entity_name == "Full Workflow"
-
-    def test_events_from_different_agents(self, store):
+        assert events.size() == 5
+        recent = events.get_recent(limit=5)
+
+        # Verify event types and names (newest first)
+        assert list(map(attrgetter("event_type", "entity_name"), recent)) == [
+            (EventType.TASK_CREATED, "Task 2"),
+            (EventType.TASK_CREATED, "Task 1"),
+            (EventType.STORY_CREATED, "User Story"),
+            (EventType.PRD_CREATED, "Feature PRD"),
+            (EventType.PROJECT_CREATED, "Full Workflow"),
+        ]
+
+    def test_events_from_different_agents(self, factory, events):
         """Test tracking events from multiple agents."""
-        events = get_event_queue()
-        
-        project = store.create_project(
-            ProjectCreate(name="Multi-Agent Project"),
-            agent_id="agent1",
-        )
-        
-        prd = store.create_prd(
-            PRDCreate(
-                project_id=project.id,
-                agent_id="agent2",
-                title="PRD",
-                description="PRD description",
-            ),
-            agent_id="agent2",
-        )
-        
-        story = store.create_story(
-            StoryCreate(
-                prd_id=prd.id,
-                agent_id="agent3",
-                title="Story",
-                description="Story description",
-            ),
-            agent_id="agent3",
-        )
-        
+        project = factory.make_project("Multi-Agent Project", agent_id="agent1")
+        prd = factory.make_prd(project, "PRD", agent_id="agent2")
+        factory.make_story(prd, "Story", agent_id="agent3")
+
         # Check agent filtering
         agent1_events = events.get_by_agent("agent1")
         assert len(agent1_events) == 1
         assert agent1_events[0].event_type == EventType.PROJECT_CREATED
-        
+
         agent2_events = events.get_by_agent("agent2")
         assert len(agent2_events) == 1
         assert agent2_events[0].event_type == EventType.PRD_CREATED
-        
+
         agent3_events = events.get_by_agent("agent3")
         assert len(agent3_events) == 1
         assert agent3_events[0].event_type == EventType.STORY_CREATED
 
+
+class TestTransactionEvents:
+    """Test that events follow the outcome of a store transaction."""
+
+    def test_events_published_on_commit(self, store, factory, events):
+        """Test that events are held until the transaction commits."""
+        with store.transaction():
+            project = factory.make_project("Committed")
+            factory.make_prd(project)
+            assert events.size() == 0
+
+        assert [e.event_type for e in events.get_recent()] == [
+            EventType.PRD_CREATED,
+            EventType.PROJECT_CREATED,
+        ]
+
+    def test_events_discarded_on_rollback(self, store, factory, events):
+        """Test that a rolled back transaction publishes no events."""
+        with pytest.raises(ValueError):
+            with store.transaction():
+                project = factory.make_project("Ghost")
+                story = factory.make_story(factory.make_prd(project))
+                factory.make_task(story)
+                store.create_tasks(
+                    [
+                        TaskCreate.model_construct(
+                            story_id="nonexistent",
+                            agent_id="system",
+                            title="Orphan",
+                            description="Orphan description",
+                            assigned_to="system",
+                        )
+                    ]
+                )
+
+        assert store.list_projects() == []
+        assert events.size() == 0